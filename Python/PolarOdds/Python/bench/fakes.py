@@ -0,0 +1,77 @@
+import itertools
+import time
+
+_ids = itertools.count(1)
+
+
+class FakeUser:
+    def __init__(self, user_id: int):
+        self.id = user_id
+        self.mention = f"<@{user_id}>"
+
+    async def send(self, *args, **kwargs):
+        pass
+
+
+class FakeResponse:
+    def __init__(self, interaction):
+        self.interaction = interaction
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    def _respond(self, kind: str, kwargs: dict):
+        self._done = True
+        self.interaction.record(kind, kwargs)
+
+    async def defer(self, **kwargs):
+        self._respond("defer", kwargs)
+
+    async def send_message(self, content=None, **kwargs):
+        self._respond("send_message", {"content": content, **kwargs})
+
+    async def edit_message(self, **kwargs):
+        self._respond("edit_message", kwargs)
+
+
+class FakeFollowup:
+    def __init__(self, interaction):
+        self.interaction = interaction
+
+    async def send(self, content=None, **kwargs):
+        self.interaction.record("followup", {"content": content, **kwargs})
+
+
+class FakeInteraction:
+    # Just enough of discord.Interaction for the stats command and its views:
+    # response/followup calls are recorded with a timestamp instead of sent.
+    def __init__(self, user_id: int = None):
+        self.id = next(_ids)
+        self.user = FakeUser(user_id or self.id)
+        self.guild = None
+        self.command = None
+        self.extras = {}
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+        self.created_at = time.perf_counter()
+        self.events = []
+
+    def record(self, kind: str, kwargs: dict):
+        self.events.append((kind, time.perf_counter(), kwargs))
+
+    def first(self, kind: str):
+        for event in self.events:
+            if event[0] == kind:
+                return event
+        return None
+
+    @property
+    def replied_at(self) -> float:
+        replies = [at for kind, at, _ in self.events if kind != "defer"]
+        return replies[0] if replies else None
+
+    @property
+    def reply(self) -> dict:
+        replies = [kwargs for kind, _, kwargs in self.events if kind != "defer"]
+        return replies[-1] if replies else None
@@ -0,0 +1,88 @@
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench.replay import load_fixture, save_fixture
+from cogs.stats import current_season_year
+from utils.mlb_api import MLBStatsClient
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+async def fetch_mlb(player_ids: list):
+    client = MLBStatsClient()
+    responses, latencies = {}, []
+    try:
+        for player_id, group in player_ids:
+            start = time.perf_counter()
+            responses[str(player_id)] = await client.player_stats(player_id, group=group)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        await client.close()
+    return responses, latencies
+
+
+def record_mlb(player_ids: list):
+    responses, latencies = asyncio.run(fetch_mlb(player_ids))
+    save_fixture("mlb_player_stat_data", {"latency": statistics.median(latencies), "responses": responses})
+
+
+def record_nba(player_ids: list):
+    from nba_api.stats.endpoints import playerdashboardbyyearoveryear
+    current_year = current_season_year()
+    season = f"{current_year}-{str(current_year + 1)[2:]}"
+    responses, latencies = {}, []
+    for player_id in player_ids:
+        dashboard, elapsed = timed(
+            playerdashboardbyyearoveryear.PlayerDashboardByYearOverYear,
+            player_id=player_id, per_mode_detailed="PerGame", season=season
+        )
+        responses[str(player_id)] = dashboard.get_dict()["resultSets"][0]
+        latencies.append(elapsed)
+    save_fixture("nba_player_dashboard", {"latency": statistics.median(latencies), "responses": responses})
+
+
+def record_nfl(player_ids: list):
+    import nfl_data_py as nfl
+    season = current_season_year()
+    start = time.perf_counter()
+    roster = nfl.import_seasonal_rosters([season])
+    weekly = nfl.import_weekly_data([season])
+    latency = time.perf_counter() - start
+    roster = roster[roster["player_id"].isin(player_ids)]
+    weekly = weekly[weekly["player_id"].isin(player_ids)]
+    save_fixture("nfl_season", {
+        "latency": latency,
+        "roster": roster.to_dict("records"),
+        "weekly": weekly.to_dict("records"),
+    })
+
+
+def fixture_ids():
+    mlb = load_fixture("mlb_player_stat_data")["responses"]
+    mlb_ids = [(int(pid), raw["stats"][0]["group"] if raw.get("stats") else "hitting") for pid, raw in mlb.items()]
+    nba_ids = [int(pid) for pid in load_fixture("nba_player_dashboard")["responses"]]
+    nfl_ids = [row["player_id"] for row in load_fixture("nfl_season")["roster"]]
+    return mlb_ids, nba_ids, nfl_ids
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-record benchmark fixtures from the live providers")
+    parser.add_argument("sports", nargs="*", default=["MLB", "NBA", "NFL"])
+    args = parser.parse_args()
+
+    mlb_ids, nba_ids, nfl_ids = fixture_ids()
+    recorders = {"MLB": (record_mlb, mlb_ids), "NBA": (record_nba, nba_ids), "NFL": (record_nfl, nfl_ids)}
+    for sport in args.sports:
+        recorder, ids = recorders[sport.upper()]
+        print(f"Recording {sport.upper()} fixtures for {len(ids)} players...")
+        recorder(ids)
@@ -0,0 +1,117 @@
+import asyncio
+import json
+import os
+import time
+
+import pandas as pd
+
+from utils.nfl_data import NFLSeasonData, aggregate_weekly
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def load_fixture(name: str) -> dict:
+    with open(os.path.join(FIXTURE_DIR, f"{name}.json"), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_fixture(name: str, data: dict):
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    with open(os.path.join(FIXTURE_DIR, f"{name}.json"), "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1, default=str)
+
+
+class ReplayModule:
+    # Stands in for a lazily imported provider module. defer() hands back
+    # callables that sleep for the recorded provider latency (scaled) and
+    # return the recorded response, so pool sizing and timeouts still apply.
+    def __init__(self, handlers: dict, latency: float = 0.0):
+        self.handlers = handlers
+        self.latency = latency
+        self.calls = 0
+
+    def defer(self, attr: str):
+        handler = self.handlers[attr]
+
+        def call(*args, **kwargs):
+            self.calls += 1
+            if self.latency:
+                time.sleep(self.latency)
+            return handler(*args, **kwargs)
+        call.__name__ = attr
+        return call
+
+    def __getattr__(self, attr):
+        handlers = self.__dict__.get("handlers", {})
+        if attr in handlers:
+            return self.defer(attr)
+        raise AttributeError(attr)
+
+
+class ReplayDashboard:
+    def __init__(self, result: dict):
+        self.result = result
+
+    def get_data_frames(self) -> list:
+        if self.result is None:
+            return [pd.DataFrame()]
+        return [pd.DataFrame(self.result["rowSet"], columns=self.result["headers"])]
+
+
+def nba_dashboard_replay(latency_scale: float = 1.0) -> ReplayModule:
+    fixture = load_fixture("nba_player_dashboard")
+    responses = fixture["responses"]
+
+    def dashboard(player_id, **kwargs):
+        return ReplayDashboard(responses.get(str(player_id)))
+    return ReplayModule({"PlayerDashboardByYearOverYear": dashboard}, fixture["latency"] * latency_scale)
+
+
+class ReplayMLBClient:
+    # Async stand-in for MLBStatsClient; one recorded latency per request,
+    # bulk or not, like the real personIds hydration.
+    def __init__(self, players: list, latency_scale: float = 1.0):
+        fixture = load_fixture("mlb_player_stat_data")
+        self.players = players
+        self.responses = fixture["responses"]
+        self.latency = fixture["latency"] * latency_scale
+        self.calls = 0
+
+    async def _request(self):
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    async def lookup_players(self, season: int = None, sport_id: int = 1) -> list:
+        await self._request()
+        return self.players
+
+    async def player_stats(self, person_id: int, group: str = "hitting", season: int = None) -> dict:
+        await self._request()
+        return self.responses.get(str(person_id), {"id": person_id, "stats": []})
+
+    async def season_stats(self, person_ids: list, group: str = "[hitting,pitching]", season: int = None) -> dict:
+        await self._request()
+        return {pid: self.responses[str(pid)] for pid in person_ids if str(pid) in self.responses}
+
+    async def close(self):
+        pass
+
+
+def nfl_season_replay(latency_scale: float = 1.0):
+    fixture = load_fixture("nfl_season")
+    roster = pd.DataFrame(fixture["roster"])
+    weekly = pd.DataFrame(fixture["weekly"])
+    latency = fixture["latency"] * latency_scale
+
+    class ReplayNFLSeasonData(NFLSeasonData):
+        def load(self):
+            self.refresh()
+
+        def refresh(self) -> bool:
+            if latency:
+                time.sleep(latency)
+            self._swap(roster, weekly, aggregate_weekly(weekly))
+            return True
+
+    return ReplayNFLSeasonData
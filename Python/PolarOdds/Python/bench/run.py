@@ -0,0 +1,301 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from discord import app_commands
+
+import cogs.stats as stats
+from cogs.metrics import cache_lines
+from bench.fakes import FakeInteraction
+from bench.replay import ReplayMLBClient, load_fixture, nba_dashboard_replay, nfl_season_replay
+from utils.mlb_directory import MLBDirectory, read_player_dump
+from utils.nfl_data import aggregate_weekly
+from utils.store import StatsStore
+
+SPORT_CHOICES = {sport: app_commands.Choice(name=sport, value=sport) for sport in stats.SPORTS}
+
+
+def summarize(samples: list, wall: float = None) -> dict:
+    if not samples:
+        return {"n": 0}
+    values = np.asarray(samples) * 1000
+    summary = {
+        "n": len(samples),
+        "p50_ms": float(np.percentile(values, 50)),
+        "p95_ms": float(np.percentile(values, 95)),
+        "p99_ms": float(np.percentile(values, 99)),
+        "max_ms": float(values.max()),
+    }
+    if wall:
+        summary["throughput"] = len(samples) / wall
+    return summary
+
+
+def print_row(name: str, summary: dict):
+    if not summary.get("n"):
+        print(f"  {name:<34} no samples")
+        return
+    line = f"  {name:<34} n={summary['n']:<6} p50 {summary['p50_ms']:9.2f} | p95 {summary['p95_ms']:9.2f} | p99 {summary['p99_ms']:9.2f} ms"
+    if "throughput" in summary:
+        line += f" | {summary['throughput']:8.1f} req/s"
+    print(line)
+
+
+def typo(name: str, rng: random.Random) -> str:
+    if len(name) < 4:
+        return name
+    i = rng.randrange(1, len(name) - 2)
+    return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+
+
+def build_queries(players: list, seed: int) -> dict:
+    rng = random.Random(seed)
+    by_id = {p["id"]: p for p in players}
+    mlb_names = [by_id[int(pid)]["fullName"] for pid in load_fixture("mlb_player_stat_data")["responses"]]
+    nba_names = [stats.nba_players.find_player_by_id(int(pid))["full_name"] for pid in load_fixture("nba_player_dashboard")["responses"]]
+    nfl_names = [row["player_name"] for row in load_fixture("nfl_season")["roster"]]
+
+    queries = {}
+    for sport, names in (("MLB", mlb_names), ("NBA", nba_names), ("NFL", nfl_names)):
+        variants = list(names)
+        variants += [name.lower() for name in names]
+        variants += [typo(name, rng) for name in names]
+        variants += [name.split()[-1] for name in names]
+        queries[sport] = variants
+    return queries
+
+
+def install_replay(players: list, store_path: str, latency_scale: float):
+    stats.nba_dashboard = nba_dashboard_replay(latency_scale)
+    stats.mlb_api = ReplayMLBClient(players, latency_scale)
+    stats.NFLSeasonData = nfl_season_replay(latency_scale)
+    stats.stats_store = StatsStore(store_path)
+
+
+def reset_caches():
+    stats.inflight = stats.SingleFlight()
+    for cache in stats.state.stats_caches.values():
+        cache.clear()
+    for cache in stats.state.name_caches.values():
+        cache.clear()
+    # A max_stale of -inf purges every stored entry, expired or not.
+    stats.stats_store.purge_expired(-float("inf"))
+
+
+async def run_stats_command(cog, sport: str, player_name: str) -> float:
+    interaction = FakeInteraction()
+    start = time.perf_counter()
+    await stats.Stats.stats.callback(cog, interaction, SPORT_CHOICES[sport], player_name)
+    replied_at = interaction.replied_at
+    if replied_at is None:
+        raise RuntimeError(f"/stats {sport} {player_name} never replied")
+    # Let a PlayerSelect prefetch finish so it does not bleed into the
+    # next measurement.
+    view = interaction.reply.get("view")
+    if isinstance(view, stats.PlayerSelect):
+        if view.prefetch_task is not None:
+            await view.prefetch_task
+        view.stop()
+    return replied_at - start
+
+
+async def run_player_select(sport: str, matches: list, prefetch: bool, think_time: float) -> float:
+    view = stats.PlayerSelect(matches, sport)
+    if prefetch:
+        view.start_prefetch()
+    await asyncio.sleep(think_time)
+    interaction = FakeInteraction()
+    start = time.perf_counter()
+    await view.children[0].callback(interaction)
+    view.stop()
+    return interaction.first("followup")[1] - start
+
+
+async def drive(users: int, requests: list, func) -> tuple:
+    queue = list(requests)
+    samples = []
+
+    async def user():
+        while queue:
+            args = queue.pop()
+            samples.append(await func(*args))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(user() for _ in range(users)))
+    return samples, time.perf_counter() - start
+
+
+async def bench_stats_command(cog, queries: dict, args, results: dict):
+    print("/stats command (fake interactions, replayed providers)")
+    rng = random.Random(args.seed)
+    for sport in stats.SPORTS:
+        reset_caches()
+        cold, wall = await drive(args.users, [(cog, sport, q) for q in queries[sport]], run_stats_command)
+        results[f"stats.{sport}.cold"] = summarize(cold, wall)
+        print_row(f"{sport} cold ({args.users} users)", results[f"stats.{sport}.cold"])
+
+        requests = [(cog, sport, rng.choice(queries[sport])) for _ in range(args.requests)]
+        warm, wall = await drive(args.users, requests, run_stats_command)
+        results[f"stats.{sport}.warm"] = summarize(warm, wall)
+        print_row(f"{sport} warm ({args.users} users)", results[f"stats.{sport}.warm"])
+
+
+async def bench_player_select(queries: dict, args, results: dict):
+    print(f"PlayerSelect clicks after {args.think_time}s, cold caches")
+    for sport in stats.SPORTS:
+        matches = [(await stats.resolve_player(sport, name))[0] for name in queries[sport][:3]]
+        for prefetch in (False, True):
+            samples = []
+            for i in range(args.select_rounds):
+                reset_caches()
+                rotated = matches[i % len(matches):] + matches[:i % len(matches)]
+                samples.append(await run_player_select(sport, rotated, prefetch, args.think_time))
+            label = "prefetched" if prefetch else "no prefetch"
+            results[f"select.{sport}.{label}"] = summarize(samples)
+            print_row(f"{sport} {label}", results[f"select.{sport}.{label}"])
+
+
+async def bench_autocomplete(queries: dict, args, results: dict):
+    print("player_name autocomplete (every keystroke)")
+    for sport in stats.SPORTS:
+        await stats.get_player_index(sport)
+        samples = []
+        for name in queries[sport]:
+            for end in range(1, len(name) + 1):
+                start = time.perf_counter()
+                stats.complete_player_name(sport, name[:end])
+                samples.append(time.perf_counter() - start)
+        results[f"autocomplete.{sport}"] = summarize(samples)
+        print_row(sport, results[f"autocomplete.{sport}"])
+
+
+async def bench_embeds(queries: dict, args, results: dict):
+    print("create_stats_embed")
+    for sport in stats.SPORTS:
+        payloads = []
+        for name in queries[sport]:
+            matches = await stats.resolve_player(sport, name)
+            payload = await stats.get_player_stats(sport, matches[0].player_id) if matches else None
+            if payload:
+                payloads.append(payload)
+        samples = []
+        for i in range(args.requests):
+            start = time.perf_counter()
+            stats.create_stats_embed(payloads[i % len(payloads)], sport)
+            samples.append(time.perf_counter() - start)
+        results[f"embed.{sport}"] = summarize(samples)
+        print_row(sport, results[f"embed.{sport}"])
+
+
+def bench_fuzzy(players: list, args, results: dict):
+    print(f"Fuzzy match over the MLB dump ({len(players)} players)")
+    rng = random.Random(args.seed)
+    start = time.perf_counter()
+    directory = MLBDirectory(players)
+    build = time.perf_counter() - start
+    results["fuzzy.build_ms"] = build * 1000
+    print(f"  {'index build':<34} {build * 1000:9.2f} ms")
+
+    names = [p["fullName"] for p in players]
+    for label, transform in (("exact", lambda n: n), ("typo", lambda n: typo(n, rng)), ("last name", lambda n: n.split()[-1])):
+        samples = []
+        for name in names:
+            query = transform(name)
+            start = time.perf_counter()
+            directory.search(query, n=5)
+            samples.append(time.perf_counter() - start)
+        results[f"fuzzy.{label}"] = summarize(samples)
+        print_row(label, results[f"fuzzy.{label}"])
+
+
+def synthetic_weekly(players: int, weeks: int, seed: int):
+    import pandas as pd
+    rng = np.random.default_rng(seed)
+    template = pd.DataFrame(load_fixture("nfl_season")["weekly"])
+    columns = [c for c in template.select_dtypes("number").columns if c not in ("season", "week")]
+    rows = players * weeks
+    frame = pd.DataFrame({
+        "player_id": np.tile([f"00-{i:07d}" for i in range(players)], weeks),
+        "season": 2024,
+        "week": np.repeat(np.arange(1, weeks + 1), players),
+    })
+    for column in columns:
+        scale = max(float(template[column].max()), 1.0)
+        frame[column] = rng.uniform(0, scale, rows).round(0 if template[column].dtype.kind == "i" else 1)
+    return frame
+
+
+def bench_nfl_aggregation(args, results: dict):
+    print(f"NFL aggregation ({args.nfl_players} players x {args.nfl_weeks} weeks)")
+    weekly = synthetic_weekly(args.nfl_players, args.nfl_weeks, args.seed)
+
+    full, lookups = [], []
+    totals = None
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        totals = aggregate_weekly(weekly)
+        full.append(time.perf_counter() - start)
+
+    ids = list(totals.index)
+    for player_id in ids[:args.requests]:
+        start = time.perf_counter()
+        totals.loc[player_id].to_dict()
+        lookups.append(time.perf_counter() - start)
+
+    for label, samples in (("full season", full), ("player totals lookup", lookups)):
+        results[f"nfl.{label}"] = summarize(samples)
+        print_row(label, results[f"nfl.{label}"])
+
+
+async def main(args):
+    players = read_player_dump()
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        install_replay(players, os.path.join(tmp, "stats.db"), args.latency_scale)
+        cog = stats.Stats(None)
+        await stats.ensure_mlb_directory()
+        queries = build_queries(players, args.seed)
+
+        await bench_stats_command(cog, queries, args, results)
+        await bench_player_select(queries, args, results)
+        await bench_autocomplete(queries, args, results)
+        await bench_embeds(queries, args, results)
+        stats.providers.shutdown()
+        stats.stats_store.close()
+
+    bench_fuzzy(players, args, results)
+    bench_nfl_aggregation(args, results)
+
+    print("Cache lookups")
+    for line in cache_lines():
+        print(f"  {line.replace('`', '')}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the /stats pipeline")
+    parser.add_argument("--users", type=int, default=10, help="concurrent simulated users")
+    parser.add_argument("--requests", type=int, default=500, help="requests per warm scenario")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="multiplier for recorded provider latency (0 disables)")
+    parser.add_argument("--think-time", type=float, default=0.5, help="delay before a PlayerSelect click")
+    parser.add_argument("--select-rounds", type=int, default=5)
+    parser.add_argument("--nfl-players", type=int, default=600)
+    parser.add_argument("--nfl-weeks", type=int, default=18)
+    parser.add_argument("--repeat", type=int, default=20, help="repetitions for the NFL aggregation timings")
+    parser.add_argument("--seed", type=int, default=21)
+    parser.add_argument("--json", help="write results to this file for comparing runs")
+    asyncio.run(main(parser.parse_args()))
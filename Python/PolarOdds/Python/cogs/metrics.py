@@ -0,0 +1,98 @@
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+import asyncio
+import math
+import time
+from utils.metrics import metrics, record_command, write_metrics_file
+
+OWNER_ID = 825106419333857312
+LAG_PROBE_INTERVAL = 0.5
+EXPORT_INTERVAL = 30
+CACHE_RESULTS = ("hit", "stale", "miss", "expired")
+
+
+def format_ms(seconds: float) -> str:
+    return f"{seconds * 1000:.0f}" if seconds >= 0.01 else f"{seconds * 1000:.1f}"
+
+
+def histogram_lines(name: str, label: str) -> list:
+    lines = []
+    for (metric, labels), histogram in sorted(metrics.histograms.items()):
+        if metric != name:
+            continue
+        key = dict(labels).get(label, "all")
+        quantiles = "/".join(format_ms(histogram.quantile(q)) for q in (0.5, 0.95, 0.99))
+        lines.append(f"`{key}` n={histogram.count} p50/p95/p99 {quantiles} ms")
+    return lines
+
+
+def cache_lines() -> list:
+    caches = sorted({dict(labels)["cache"] for name, labels in metrics.counters if name == "cache_lookups_total"})
+    lines = []
+    for cache in caches:
+        counts = {result: metrics.counter_value("cache_lookups_total", cache=cache, result=result) for result in CACHE_RESULTS}
+        total = sum(counts.values())
+        served = counts["hit"] + counts["stale"]
+        evictions = metrics.counter_value("cache_evictions_total", cache=cache)
+        lines.append(
+            f"`{cache}` {served / total:.0%} served ({int(counts['hit'])} fresh, {int(counts['stale'])} stale, "
+            f"{int(counts['miss'] + counts['expired'])} miss), {int(evictions)} evicted"
+        )
+    return lines
+
+
+class Metrics(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def cog_load(self):
+        self.measure_loop_lag.start()
+        self.export_metrics.start()
+
+    async def cog_unload(self):
+        self.measure_loop_lag.cancel()
+        self.export_metrics.cancel()
+
+    @commands.Cog.listener()
+    async def on_app_command_completion(self, interaction: discord.Interaction, command):
+        record_command(interaction, "ok")
+
+    @tasks.loop(seconds=1)
+    async def measure_loop_lag(self):
+        start = time.perf_counter()
+        await asyncio.sleep(LAG_PROBE_INTERVAL)
+        metrics.observe("event_loop_lag_seconds", max(0.0, time.perf_counter() - start - LAG_PROBE_INTERVAL))
+
+    @tasks.loop(seconds=EXPORT_INTERVAL)
+    async def export_metrics(self):
+        if math.isfinite(self.bot.latency):
+            metrics.set("gateway_latency_seconds", self.bot.latency)
+        try:
+            await asyncio.to_thread(write_metrics_file, metrics.render())
+        except Exception as e:
+            print(f"Error writing metrics file: {e}")
+
+    @app_commands.command(name="metrics", description="Owner only - Show bot latency and cache metrics")
+    async def show_metrics(self, interaction: discord.Interaction):
+        if interaction.user.id != OWNER_ID:
+            await interaction.response.send_message("Only the bot owner can use this command!", ephemeral=True)
+            return
+
+        em = discord.Embed(title="Bot Metrics", color=0xd6e1ff)
+        sections = [
+            ("Commands", histogram_lines("command_latency_seconds", "command")),
+            ("Providers", histogram_lines("provider_call_seconds", "provider")),
+            ("Fuzzy Match", histogram_lines("fuzzy_match_seconds", "sport")),
+            ("Odds Fetch", histogram_lines("odds_fetch_seconds", "sport")),
+            ("Event Loop Lag", histogram_lines("event_loop_lag_seconds", "loop")),
+            ("Caches", cache_lines()),
+        ]
+        for name, lines in sections:
+            value = "\n".join(lines) or "No data yet"
+            em.add_field(name=name, value=value[:1024], inline=False)
+
+        await interaction.response.send_message(embed=em, ephemeral=True)
+
+async def setup(bot):
+    await bot.add_cog(Metrics(bot))
@@ -3,89 +3,120 @@ from discord import app_commands
 from discord.ext import commands
 from datetime import datetime, timedelta
 import pytz
+import asyncio
+from utils.automod import RuleEngine
+from utils.snipe import DeletedMessage, EditedMessage, SnipeLog
+from utils.enforcement import EnforcementQueue
+
+OWNER_ID = 825106419333857312
 
 class Moderation(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.sniped_message = None
-        self.sniped_author = None
-        self.edited_old = None
-        self.edited_new = None
-        self.edited_author = None
+        self.automod = RuleEngine()
+        self.automod.load()
+        self.deleted = SnipeLog()
+        self.edited = SnipeLog()
+        self.enforcement = EnforcementQueue()
+
+    async def cog_unload(self):
+        await self.enforcement.close()
 
     @commands.Cog.listener()
     async def on_message_delete(self, message):
-        self.sniped_message = message.content
-        self.sniped_author = str(message.author)
+        guild_id = message.guild.id if message.guild else None
+        self.deleted.add(guild_id, message.channel.id, DeletedMessage(message.content, str(message.author)))
 
     @commands.Cog.listener()
     async def on_message_edit(self, before, after):
-        self.edited_old = before.content
-        self.edited_new = after.content
-        self.edited_author = after.author
+        if before.content == after.content:
+            return
+        guild_id = after.guild.id if after.guild else None
+        self.edited.add(guild_id, after.channel.id, EditedMessage(before.content, after.content, str(after.author)))
 
     @app_commands.command(name="s", description="View the most recently deleted message in this channel.")
     async def snipe(self, interaction: discord.Interaction):
-        if self.sniped_message is None:
+        sniped = self.deleted.latest(interaction.guild_id, interaction.channel_id)
+        if sniped is None:
             nomsg = discord.Embed(color=discord.Color.light_grey())
             nomsg.description = f"<:xmark:1136292933268672522> {interaction.user.mention}: Snipe failed; no recently **deleted messages**"
             await interaction.response.send_message(embed=nomsg, ephemeral=False)
         else:
             msg = discord.Embed(color=discord.Color.magenta())
-            msg.description = self.sniped_message
-            msg.set_author(name=self.sniped_author)
+            msg.description = sniped.content
+            msg.set_author(name=sniped.author)
             await interaction.response.send_message(embed=msg, ephemeral=False)
 
-    @app_commands.command(name="cs", description="Clear recently deleted message history.")
+    @app_commands.command(name="cs", description="Clear recently deleted message history in this channel.")
     async def clear_snipe(self, interaction: discord.Interaction):
-        if self.sniped_message is None:
+        if not self.deleted.clear(interaction.guild_id, interaction.channel_id):
             none = discord.Embed(color=discord.Color.light_grey())
             none.description = f"<:xmark:1136292933268672522> {interaction.user.mention}: There are no **recently deleted** messages to **clear**"
             await interaction.response.send_message(embed=none)
         else:
-            self.sniped_message = None
-            self.sniped_author = None
             cem = discord.Embed(color=discord.Color.magenta())
             cem.description = f"<:check:1136292889111048304> {interaction.user.mention}: Previously **deleted messages** were **cleared**"
             await interaction.response.send_message(embed=cem, ephemeral=False)
 
-    @app_commands.command(name="es", description="View the most recently edited message")
+    @app_commands.command(name="es", description="View the most recently edited message in this channel")
     async def edit_snipe(self, interaction: discord.Interaction):
-        if self.edited_new is None:
+        edited = self.edited.latest(interaction.guild_id, interaction.channel_id)
+        if edited is None:
             nonew = discord.Embed(color=discord.Color.light_grey())
             nonew.description = f"<:xmark:1136292933268672522> {interaction.user.mention}: There are no recently **edited messages**"
             await interaction.response.send_message(embed=nonew)
         else:
             yesnew = discord.Embed(color=discord.Color.magenta())
-            yesnew.description = f"Original: *{self.edited_old}*\n> New: *{self.edited_new}*"
-            yesnew.set_author(name=self.edited_author)
+            yesnew.description = f"Original: *{edited.before}*\n> New: *{edited.after}*"
+            yesnew.set_author(name=edited.author)
             await interaction.response.send_message(embed=yesnew)
 
     @commands.Cog.listener()
     async def on_message(self, message):
-        if message.author.bot:
+        if message.guild is None or message.author.bot:
+            return
+        
+        rules = self.automod.for_guild(message.guild.id)
+        if rules.search(message.content) is None:
+            return
+        if rules.is_exempt(message.author):
+            return
+        
+        self.enforcement.delete(message)
+        self.enforcement.punish((message.guild.id, message.author.id), self.enforce_link_rule, message, rules)
+
+    async def enforce_link_rule(self, message, rules):
+        em = discord.Embed(color=discord.Color.light_grey())
+        em.description = f"⚠️ {message.author.mention}: **Links** are not allowed in this server."
+        if rules.notice_channel_id:
+            em.description += f" You have been put in <#{rules.notice_channel_id}>"
+        
+        actions = [message.author.send(embed=em), message.channel.send(embed=em)]
+        
+        timeoutrole = message.guild.get_role(rules.timeout_role_id) if rules.timeout_role_id else None
+        if timeoutrole:
+            actions.append(message.author.add_roles(timeoutrole))
+        
+        if rules.timeout_seconds:
+            duration = timedelta(seconds=rules.timeout_seconds)
+            actions.append(message.author.timeout(duration, reason=f"{message.author} timed out by PolarOdds: AutoMod (Link Blocking)."))
+        
+        for result in await asyncio.gather(*actions, return_exceptions=True):
+            if isinstance(result, Exception):
+                print(f"AutoMod action failed for {message.author}: {result}")
+
+    @app_commands.command(name="automodreload", description="Owner only - Reload AutoMod rules")
+    async def automod_reload(self, interaction: discord.Interaction):
+        if interaction.user.id != OWNER_ID:
+            await interaction.response.send_message("Only the bot owner can use this command!", ephemeral=True)
             return
-            
-        adminrole = message.guild.get_role(133586119356285124)
-        timeoutrole = message.guild.get_role(1338586765342019604)
         
-        not_allowed = ['discord.gg', 'https://']
-        for notallowed in not_allowed:
-            if notallowed in message.content:
-                if adminrole in message.author.roles:
-                    return
-                    
-                await message.delete()
-                await message.author.add_roles(timeoutrole)
-                
-                em = discord.Embed(color=discord.Color.light_grey())
-                em.description = f"⚠️ {message.author.mention}: **Links** are not allowed in this server. You have been put in <#1338941852052754453>"
-                
-                await message.author.send(embed=em)
-                await message.channel.send(embed=em)
-                
-                duration = timedelta(seconds=59, minutes=59, hours=23, days=13)
-                await message.author.timeout(duration, reason=f"{message.author} timed out by PolarOdds: AutoMod (Link Blocking).")
+        try:
+            guilds = self.automod.load()
+            await interaction.response.send_message(f"AutoMod rules reloaded ({guilds} guild overrides).", ephemeral=True)
+        except Exception as e:
+            print(f"Failed to reload AutoMod rules: {e}")
+            await interaction.response.send_message(f"Failed to reload AutoMod rules: {e}", ephemeral=True)
 
 async def setup(bot):
     await bot.add_cog(Moderation(bot)) 
\ No newline at end of file
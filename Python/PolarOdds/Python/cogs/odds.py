@@ -0,0 +1,71 @@
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+from utils.odds import SPORTS, load_odds_provider, odds_books
+from utils.metrics import metrics
+
+OWNER_ID = 825106419333857312
+POLL_INTERVALS = {"NBA": 60, "NFL": 120, "MLB": 60}
+
+
+def format_price(price: int) -> str:
+    return f"+{price}" if price > 0 else str(price)
+
+
+class Odds(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.provider = None
+        self.pollers = {sport: tasks.loop(seconds=POLL_INTERVALS[sport])(self.poll_odds) for sport in SPORTS}
+
+    async def cog_load(self):
+        self.provider = load_odds_provider()
+        if self.provider is None:
+            return
+        for sport, poller in self.pollers.items():
+            poller.start(sport)
+
+    async def cog_unload(self):
+        for poller in self.pollers.values():
+            poller.cancel()
+
+    async def poll_odds(self, sport: str):
+        try:
+            with metrics.timer("odds_fetch_seconds", sport=sport):
+                events = await self.provider.fetch(sport)
+        except Exception as e:
+            print(f"Error polling {sport} odds from {self.provider.name}: {e}")
+            return
+
+        for movement in odds_books[sport].apply(events):
+            self.bot.dispatch("line_movement", movement)
+
+    @app_commands.command(name="odds", description="Show the latest odds for a sport")
+    @app_commands.choices(sport=[
+        app_commands.Choice(name="NBA", value="NBA"),
+        app_commands.Choice(name="NFL", value="NFL"),
+        app_commands.Choice(name="MLB", value="MLB")
+    ])
+    async def odds(self, interaction: discord.Interaction, sport: app_commands.Choice[str]):
+        if self.provider is None or (not self.provider.live and interaction.user.id != OWNER_ID):
+            await interaction.response.send_message("Odds aren't available yet.", ephemeral=True)
+            return
+
+        snapshot = odds_books[sport.value].snapshot()
+        if not snapshot['events']:
+            await interaction.response.send_message(f"No {sport.value} odds available right now.", ephemeral=True)
+            return
+
+        em = discord.Embed(title=f"{sport.value} Odds", color=0xd6e1ff)
+        for event in list(snapshot['events'].values())[:10]:
+            lines = []
+            for selection, line in event['markets'].get('h2h', {}).items():
+                lines.append(f"{selection}: {format_price(line['price'])}")
+            for selection, line in event['markets'].get('spreads', {}).items():
+                lines.append(f"{selection} {line['point']:+g}: {format_price(line['price'])}")
+            em.add_field(name=f"{event['away_team']} @ {event['home_team']}", value="\n".join(lines) or "No lines", inline=False)
+        em.set_footer(text=f"Updated: {snapshot['updated_at']}")
+        await interaction.response.send_message(embed=em)
+
+async def setup(bot):
+    await bot.add_cog(Odds(bot))
@@ -0,0 +1,118 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+from utils.odds import odds_books
+from utils.parlay import book_legs, evaluate_parlay, implied_probability, load_projections, rank_parlays, remove_vig
+
+OWNER_ID = 825106419333857312
+
+
+def parse_legs(legs: str):
+    prices = []
+    probabilities = []
+    for raw in legs.split(","):
+        raw = raw.strip()
+        if not raw:
+            continue
+        sides = [float(side) for side in raw.split("/")]
+        if any(abs(side) < 100 for side in sides):
+            raise ValueError(f"{raw} is not valid American odds")
+        prices.append(sides[0])
+        if len(sides) > 1:
+            probabilities.append(float(remove_vig(sides)[0]))
+        else:
+            probabilities.append(float(implied_probability(sides[0])))
+    return prices, probabilities
+
+
+def format_american(odds: float) -> str:
+    return f"+{odds:.0f}" if odds > 0 else f"{odds:.0f}"
+
+
+class Parlay(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="parlay", description="Calculate parlay odds, probability and expected value")
+    @app_commands.describe(
+        legs="Comma separated American odds. Add the other side to remove the vig, e.g. -110/-110, +150",
+        stake="Amount wagered"
+    )
+    async def parlay(self, interaction: discord.Interaction, legs: str, stake: app_commands.Range[float, 0.01] = 10.0):
+        try:
+            prices, probabilities = parse_legs(legs)
+        except ValueError as e:
+            await interaction.response.send_message(f"Could not read legs: {e}", ephemeral=True)
+            return
+
+        if not prices:
+            await interaction.response.send_message("Please provide at least one leg.", ephemeral=True)
+            return
+
+        scores = evaluate_parlay(prices, probabilities)
+        implied = implied_probability(prices)
+
+        em = discord.Embed(title=f"{len(prices)}-Leg Parlay", color=0xd6e1ff)
+        em.description = "\n".join(
+            f"`{format_american(price)}` Implied {implied[i] * 100:.1f}% | Fair {probabilities[i] * 100:.1f}%"
+            for i, price in enumerate(prices)
+        )
+        em.add_field(name="Parlay Odds", value=format_american(scores.american_odds[0]), inline=True)
+        em.add_field(name="Payout", value=f"{stake * scores.decimal_odds[0]:.2f}", inline=True)
+        em.add_field(name="Hit Chance", value=f"{scores.probability[0] * 100:.2f}%", inline=True)
+        em.add_field(name="Fair Odds", value=format_american(scores.fair_american_odds[0]), inline=True)
+        em.add_field(name="Expected Value", value=f"{stake * scores.expected_value[0]:+.2f} ({scores.expected_value[0] * 100:+.1f}%)", inline=True)
+        await interaction.response.send_message(embed=em)
+
+    @app_commands.command(name="parlayscan", description="Owner only - Rank parlays from the current odds and projections")
+    @app_commands.describe(
+        legs="Legs per parlay",
+        top="How many parlays to show",
+        ping="Send the best parlay to Pick Pings if its EV is positive"
+    )
+    @app_commands.choices(sport=[
+        app_commands.Choice(name="NBA", value="NBA"),
+        app_commands.Choice(name="NFL", value="NFL"),
+        app_commands.Choice(name="MLB", value="MLB")
+    ])
+    async def parlayscan(self, interaction: discord.Interaction, sport: app_commands.Choice[str], legs: app_commands.Range[int, 2, 6] = 2, top: app_commands.Range[int, 1, 10] = 5, ping: bool = False):
+        if interaction.user.id != OWNER_ID:
+            await interaction.response.send_message("Only the bot owner can use this command!", ephemeral=True)
+            return
+
+        try:
+            projections = load_projections(sport.value)
+        except (KeyError, ValueError) as e:
+            await interaction.response.send_message(f"Could not read projections: {e}", ephemeral=True)
+            return
+
+        labels, prices, probabilities, groups = book_legs(odds_books[sport.value], projections)
+        if len(labels) < legs:
+            await interaction.response.send_message(f"Only {len(labels)} {sport.value} legs have both odds and a projection.", ephemeral=True)
+            return
+
+        scores = rank_parlays(prices, probabilities, legs, top=top, groups=groups)
+        if not len(scores.combos):
+            await interaction.response.send_message(f"No {legs}-leg {sport.value} parlays without two legs from one game.", ephemeral=True)
+            return
+
+        em = discord.Embed(title=f"Top {sport.value} {legs}-Leg Parlays", color=0xd6e1ff)
+        for i, combo in enumerate(scores.combos):
+            em.add_field(
+                name=f"{format_american(scores.american_odds[i])} | EV {scores.expected_value[i] * 100:+.1f}%",
+                value="\n".join(labels[leg] for leg in combo) + f"\nHit chance {scores.probability[i] * 100:.1f}%",
+                inline=False
+            )
+
+        if ping:
+            picks = self.bot.get_cog("Picks")
+            if picks is None or scores.expected_value[0] <= 0:
+                em.set_footer(text="Best parlay was not sent to Pick Pings.")
+            else:
+                pick = discord.Embed(title=f"New {sport.value} Pick", description="\n".join(labels[leg] for leg in scores.combos[0]), color=0xd6e1ff)
+                pick.add_field(name="Odds", value=format_american(scores.american_odds[0]), inline=True)
+                em.set_footer(text=f"Queued {picks.notify_pick(pick)} Pick Pings deliveries.")
+        await interaction.response.send_message(embed=em, ephemeral=True)
+
+async def setup(bot):
+    await bot.add_cog(Parlay(bot))
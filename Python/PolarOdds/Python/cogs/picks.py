@@ -0,0 +1,96 @@
+import discord
+import json
+import os
+from discord import app_commands
+from discord.ext import commands
+from utils.dispatcher import Dispatcher, Notification, PRIORITY_HIGH, PRIORITY_NORMAL
+
+OWNER_ID = 825106419333857312
+GUILD_ID = 1338581149374480496
+PICK_PINGS_ROLE_ID = 1338599707756462141
+PICKS_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'picks.json')
+
+
+def load_pick_channel_ids(path: str = PICKS_CONFIG_PATH) -> list:
+    config = {}
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+    channel_ids = [int(channel_id) for channel_id in config.get("channel_ids", [])]
+    if not channel_ids:
+        print(f"Warning: no pick channels configured in {path}, picks will only be sent by DM")
+    return channel_ids
+
+
+class Picks(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.dispatcher = Dispatcher()
+        self.channel_ids = []
+
+    async def cog_load(self):
+        self.channel_ids = load_pick_channel_ids()
+        self.dispatcher.start()
+
+    async def cog_unload(self):
+        await self.dispatcher.close()
+
+    def notify_pick(self, em: discord.Embed, priority: int = PRIORITY_NORMAL) -> int:
+        guild = self.bot.get_guild(GUILD_ID)
+        deliveries = 0
+
+        for channel_id in self.channel_ids:
+            channel = self.bot.get_channel(channel_id)
+            if channel is None:
+                print(f"Pick channel {channel_id} not found")
+                continue
+            self.dispatcher.submit(Notification(channel, content=f"<@&{PICK_PINGS_ROLE_ID}>", embeds=[em], priority=priority))
+            deliveries += 1
+
+        role = guild.get_role(PICK_PINGS_ROLE_ID) if guild else None
+        if role is not None:
+            for member in role.members:
+                if member.bot:
+                    continue
+                self.dispatcher.submit(Notification(member, embeds=[em], priority=priority))
+                deliveries += 1
+
+        return deliveries
+
+    @app_commands.command(name="pick", description="Owner only - Send a pick to Pick Pings")
+    @app_commands.choices(sport=[
+        app_commands.Choice(name="NBA", value="NBA"),
+        app_commands.Choice(name="NFL", value="NFL"),
+        app_commands.Choice(name="MLB", value="MLB")
+    ])
+    async def pick(self, interaction: discord.Interaction, sport: app_commands.Choice[str], pick: str, odds: str = None, urgent: bool = False):
+        if interaction.user.id != OWNER_ID:
+            await interaction.response.send_message("Only the bot owner can use this command!", ephemeral=True)
+            return
+
+        em = discord.Embed(title=f"New {sport.value} Pick", description=pick, color=0xd6e1ff)
+        if odds:
+            em.add_field(name="Odds", value=odds, inline=True)
+
+        deliveries = self.notify_pick(em, PRIORITY_HIGH if urgent else PRIORITY_NORMAL)
+        await interaction.response.send_message(f"Queued {deliveries} deliveries.", ephemeral=True)
+
+    @app_commands.command(name="pingstats", description="Owner only - Pick Pings delivery stats")
+    async def pingstats(self, interaction: discord.Interaction):
+        if interaction.user.id != OWNER_ID:
+            await interaction.response.send_message("Only the bot owner can use this command!", ephemeral=True)
+            return
+
+        metrics = self.dispatcher.metrics
+        em = discord.Embed(title="Pick Pings Delivery", color=0xd6e1ff)
+        em.add_field(name="Queued", value=str(metrics['queued']), inline=True)
+        em.add_field(name="Pending", value=str(self.dispatcher.pending()), inline=True)
+        em.add_field(name="Delivered", value=str(metrics['delivered']), inline=True)
+        em.add_field(name="Messages", value=str(metrics['messages']), inline=True)
+        em.add_field(name="Batched", value=str(metrics['batched']), inline=True)
+        em.add_field(name="Failed", value=str(metrics['failed'] + metrics['forbidden'] + metrics['rate_limited']), inline=True)
+        em.add_field(name="Max Latency", value=f"{self.dispatcher.max_latency:.2f}s", inline=True)
+        await interaction.response.send_message(embed=em, ephemeral=True)
+
+async def setup(bot):
+    await bot.add_cog(Picks(bot))
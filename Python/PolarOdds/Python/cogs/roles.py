@@ -2,6 +2,21 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+ROLE_IDS = {
+    "parlay_tracker": 1338599658439839917,
+    "discussions": 1338599617444581488,
+    "pick_pings": 1338599707756462141
+}
+
+role_cache = {}
+
+def get_role_mapping(guild: discord.Guild) -> dict:
+    role_mapping = role_cache.get(guild.id)
+    if role_mapping is None:
+        role_mapping = {value: guild.get_role(role_id) for value, role_id in ROLE_IDS.items()}
+        role_cache[guild.id] = role_mapping
+    return role_mapping
+
 class ReactionRoles(discord.ui.View):
     def __init__(self):
         super().__init__(timeout=None)
@@ -34,30 +49,30 @@ class ReactionRoles(discord.ui.View):
     )
     async def select_callback(self, interaction: discord.Interaction, select: discord.ui.Select):
         member = interaction.user
+        role_mapping = get_role_mapping(interaction.guild)
         
-        ptrackerrole = interaction.guild.get_role(1338599658439839917)
-        discussionrole = interaction.guild.get_role(1338599617444581488)
-        pickpingsrole = interaction.guild.get_role(1338599707756462141)
-        
-        role_mapping = {
-            "parlay_tracker": ptrackerrole,
-            "discussions": discussionrole,
-            "pick_pings": pickpingsrole
-        }
+        current = {role.id for role in member.roles}
         
+        added = []
+        removed = []
         changes = []
         for value, role in role_mapping.items():
-            has_role = role in member.roles
+            if role is None:
+                continue
+            has_role = role.id in current
             should_have_role = value in select.values
             
             if should_have_role and not has_role:
-                await member.add_roles(role)
+                added.append(role)
                 changes.append(f"Added: {role.name}")
             elif not should_have_role and has_role:
-                await member.remove_roles(role)
+                removed.append(role)
                 changes.append(f"Removed: {role.name}")
         
         if changes:
+            removed_ids = {role.id for role in removed}
+            roles = [role for role in member.roles if not role.is_default() and role.id not in removed_ids] + added
+            await member.edit(roles=roles)
             await interaction.response.send_message("\n".join(changes), ephemeral=True)
         else:
             await interaction.response.send_message("No changes made to your roles", ephemeral=True)
@@ -82,5 +97,13 @@ class Roles(commands.Cog):
     async def on_ready(self):
         self.bot.add_view(ReactionRoles())
 
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role):
+        role_cache.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role):
+        role_cache.pop(role.guild.id, None)
+
 async def setup(bot):
     await bot.add_cog(Roles(bot)) 
\ No newline at end of file
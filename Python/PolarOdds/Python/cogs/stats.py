@@ -1,83 +1,346 @@
 import discord
 from discord import app_commands
-from discord.ext import commands
-import nfl_data_py as nfl
-from nba_api.stats.static import players as nba_players
-from nba_api.stats.endpoints import playerdashboardbyyearoveryear
+from discord.ext import commands, tasks
 from datetime import datetime
 import pytz
-from difflib import get_close_matches
-from cachetools import TTLCache
-import statsapi as mlbstats
-import json
-import os
+import asyncio
+import re
+import time
+from itertools import chain, zip_longest
+from utils.executor import ProviderExecutor
+from utils.lazy import lazy_import
+from utils.search import PlayerIndex, normalize_name
+from utils.nfl_data import NFLSeasonData
+from utils.cache import StatsCache
+from utils.store import StatsStore
+from utils.singleflight import SingleFlight
+from utils.odds import odds_books
+from utils.registry import get_registry
+from utils.metrics import metrics
+from utils.mlb_api import MLBStatsClient
+from utils.leaders import LEADER_STATS, build_mlb_tables, build_nba_table, build_nfl_table, format_leader_value, load_table, table_path
+from utils.mlb_directory import DUMP_PATH, get_directory as get_mlb_directory, load_directory as load_mlb_directory, write_player_dump
 
+nba_players = lazy_import("nba_api.stats.static.players")
+nba_dashboard = lazy_import("nba_api.stats.endpoints.playerdashboardbyyearoveryear")
+nba_league_dash = lazy_import("nba_api.stats.endpoints.leaguedashplayerstats")
+async def generate_player_dump(path: str = DUMP_PATH) -> list:
+    players = await mlb_api.lookup_players()
+    await providers.run("MLB", write_player_dump, players, path)
+    return players
 
-DUMP_PATH = os.path.join(os.path.dirname(__file__), 'data', 'mlb_players_dump.json')
+def current_season_year() -> int:
+    current_year = datetime.now().year
+    if datetime.now().month < 8:
+        current_year -= 1
+    return current_year
 
-def save_player_cache(players: list):
-    with open(DUMP_PATH, 'w', encoding="utf-8") as f:
-        json.dump(players, f, ensure_ascii=False, indent=2)
+def build_nba_index() -> PlayerIndex:
+    index = PlayerIndex()
+    for p in nba_players.get_players():
+        index.add(p['id'], p['full_name'], record=p, weight=1.0 if p.get('is_active') else 0.0)
+    return index
 
-import os
-import json
+def nba_season() -> str:
+    current_year = current_season_year()
+    return f"{current_year}-{str(current_year + 1)[2:]}"
 
-def load_player_cache(path: str = "data/mlb_players_dump.json"):
-    if not os.path.exists(path):
-        print(f"File not found: {path}")
-        return []
+def fetch_nba_league_dash(season: str, position: str = ""):
+    return nba_league_dash.LeagueDashPlayerStats(
+        season=season,
+        per_mode_detailed="PerGame",
+        player_position_abbreviation_nullable=position
+    ).get_data_frames()[0]
+
+def build_nfl_index(roster) -> PlayerIndex:
+    index = PlayerIndex()
+    for row in roster.to_dict('records'):
+        if not isinstance(row.get('player_id'), str):
+            continue
+        aliases = []
+        if isinstance(row.get('football_name'), str) and isinstance(row.get('last_name'), str):
+            aliases.append(f"{row['football_name']} {row['last_name']}")
+        index.add(row['player_id'], row['player_name'], aliases, record=row)
+    return index
+
+SPORTS = ("NBA", "NFL", "MLB")
+
+# Bump when the shape of StatsState or anything it holds changes, so a reload
+# starts from fresh state instead of inheriting incompatible objects.
+STATS_STATE_VERSION = 3
+
+class StatsState:
+    def __init__(self):
+        self.nba_index = None
+        self.nba_index_lock = asyncio.Lock()
+        self.mlb_directory_task = None
+        self.nfl_seasons = {}
+        self.nfl_indexes = {}
+        self.nfl_season_lock = asyncio.Lock()
+        self.stats_caches = {
+            "NBA": StatsCache(maxsize=100, ttl=3600, stale_ttl=6 * 3600, name="nba_stats"),
+            "NFL": StatsCache(maxsize=100, ttl=3600, stale_ttl=6 * 3600, name="nfl_stats"),
+            "MLB": StatsCache(maxsize=100, ttl=360, stale_ttl=3600, name="mlb_stats"),
+        }
+        self.name_caches = {
+            sport: StatsCache(maxsize=5000, ttl=6 * 3600, stale_ttl=0, name=f"{sport.lower()}_names") for sport in SPORTS
+        }
+        self.leader_tables = {}
+        self.warmed = False
+
+state = StatsState()
+
+NEGATIVE_TTL = 300
+BULK_MAX_PLAYERS = 10
+BULK_CONCURRENCY = 5
+HOT_PLAYERS = 20
+HOT_REFRESH_WINDOW = 120
+AUTOCOMPLETE_LIMIT = 25
+LEADER_TTL = 6 * 3600
+LEADER_LIMIT = 25
+PREFETCH_CONCURRENCY = 6
+refresh_tasks = {}
+index_tasks = {}
+
+providers = ProviderExecutor({
+    "NBA": {"max_workers": 4, "timeout": 20},
+    "NFL": {"max_workers": 2, "timeout": 90},
+    "MLB": {"max_workers": 4, "timeout": 15},
+    "STORE": {"max_workers": 1, "timeout": 10},
+})
+
+stats_store = None
+mlb_api = None
+inflight = SingleFlight()
+prefetch_budget = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+
+OWNER_ID = 825106419333857312
 
+async def get_stored_stats(sport: str, cache_key: str):
+    cache = state.stats_caches[sport]
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            print(f"Loaded {len(data)} players from cache.")
-            return data
+        stored = await providers.run("STORE", stats_store.get_stats, sport, cache_key, cache.stale_ttl)
     except Exception as e:
-        print(f"Error loading player cache: {e}")
-        return []
+        print(f"Error reading stored {sport} stats: {e}")
+        return None, False
+    if stored is None:
+        return None, False
+    stats, expires_at = stored
+    remaining = expires_at - time.time()
+    cache.set(cache_key, stats, ttl=remaining)
+    return stats, remaining > 0
+
+async def get_cached_stats(sport: str, cache_key: str):
+    stats, fresh = state.stats_caches[sport].lookup(cache_key)
+    if stats is None:
+        stats, fresh = await get_stored_stats(sport, cache_key)
+    if stats is not None and not fresh:
+        schedule_refresh(sport, cache_key)
+    return stats
 
+def schedule_refresh(sport: str, cache_key: str):
+    key = (sport, cache_key)
+    if key in refresh_tasks:
+        return
     
-def generate_player_dump(path: str = "data/mlb_players_dump.json"):
-    players = mlbstats.lookup_player("")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(players, f, indent=2)
+    def finish(task):
+        refresh_tasks.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Error refreshing {sport} stats for {cache_key}: {task.exception()}")
+    
+    task = asyncio.create_task(get_player_stats(sport, cache_key, use_cache=False))
+    refresh_tasks[key] = task
+    task.add_done_callback(finish)
 
-mlb_players = load_player_cache()
+async def cache_stats(sport: str, cache_key: str, stats: dict, ttl: float = None):
+    cache = state.stats_caches[sport]
+    ttl = cache.ttl if ttl is None else ttl
+    cache.set(cache_key, stats, ttl=ttl)
+    try:
+        await providers.run("STORE", stats_store.put_stats, sport, cache_key, stats, ttl)
+    except Exception as e:
+        print(f"Error storing {sport} stats: {e}")
 
-nba_cache = TTLCache(maxsize=100, ttl=3600)
-nfl_cache = TTLCache(maxsize=100, ttl=3600)
-mlb_cache = TTLCache(maxsize=100, ttl=360)
+async def warm_caches():
+    for sport, cache in state.stats_caches.items():
+        entries = await providers.run("STORE", stats_store.recent_stats, sport, cache.maxsize, cache.stale_ttl)
+        for cache_key, stats, expires_at in reversed(entries):
+            cache.set(cache_key, stats, ttl=expires_at - time.time())
+        print(f"Warmed {sport} cache with {len(entries)} stored entries.")
 
-OWNER_ID = 825106419333857312
+async def get_nfl_season(season: int) -> NFLSeasonData:
+    async with state.nfl_season_lock:
+        if season not in state.nfl_seasons:
+            season_data = NFLSeasonData(season)
+            await providers.run("NFL", season_data.load)
+            state.nfl_indexes[season] = await providers.run("NFL", build_nfl_index, season_data.roster)
+            state.nfl_seasons[season] = season_data
+    return state.nfl_seasons[season]
+
+async def get_nfl_index(season: int) -> PlayerIndex:
+    await get_nfl_season(season)
+    return state.nfl_indexes[season]
+
+async def get_nba_index() -> PlayerIndex:
+    async with state.nba_index_lock:
+        if state.nba_index is None:
+            state.nba_index = await providers.run("NBA", build_nba_index)
+    return state.nba_index
+
+async def ensure_mlb_directory():
+    task = state.mlb_directory_task
+    failed = task is not None and task.done() and (task.cancelled() or task.exception() is not None)
+    if task is None or failed:
+        task = asyncio.ensure_future(providers.run(
+            "MLB", load_mlb_directory, fallback=lambda: stats_store.get_players("MLB")
+        ))
+        state.mlb_directory_task = task
+    return await asyncio.shield(task)
+
+async def get_player_index(sport: str) -> PlayerIndex:
+    if sport == "NBA":
+        return await get_nba_index()
+    elif sport == "NFL":
+        return await get_nfl_index(current_season_year())
+    elif sport == "MLB":
+        await ensure_mlb_directory()
+        return get_mlb_directory().index
+    raise ValueError(f"Unknown sport: {sport}")
+
+async def resolve_player(sport: str, player_name: str) -> list:
+    name_key = normalize_name(player_name)
+    name_cache = state.name_caches[sport]
+    matches, _ = name_cache.lookup(name_key, count=False)
+    if matches is None:
+        player_index = await get_player_index(sport)
+        with metrics.timer("fuzzy_match_seconds", sport=sport):
+            matches = player_index.search(player_name, n=5)
+        name_cache.set(name_key, matches, ttl=None if matches else NEGATIVE_TTL)
+    return matches
+
+def peek_player_index(sport: str) -> PlayerIndex:
+    # Autocomplete must answer within Discord's deadline, so it never waits
+    # on an index build; a missing index is loaded in the background.
+    if sport == "NBA":
+        player_index = state.nba_index
+    elif sport == "NFL":
+        player_index = state.nfl_indexes.get(current_season_year())
+    else:
+        task = state.mlb_directory_task
+        loaded = task is not None and task.done() and not task.cancelled() and task.exception() is None
+        player_index = get_mlb_directory().index if loaded else None
+    
+    if player_index is None and sport not in index_tasks:
+        def finish(task):
+            index_tasks.pop(sport, None)
+            if not task.cancelled() and task.exception() is not None:
+                print(f"Error loading {sport} player index: {task.exception()}")
+        
+        index_tasks[sport] = asyncio.create_task(get_player_index(sport))
+        index_tasks[sport].add_done_callback(finish)
+    return player_index
+
+def encode_player_choice(sport: str, player_id) -> str:
+    return f"id:{sport}:{player_id}"
+
+def decode_player_choice(value: str):
+    parts = value.split(":", 2)
+    if len(parts) != 3 or parts[0] != "id" or parts[1] not in SPORTS or not parts[2]:
+        return None
+    if parts[1] == "NFL":
+        return parts[1], parts[2]
+    # Anything else typed after the prefix is treated as a player name.
+    if not (parts[2].isascii() and parts[2].isdigit()):
+        return None
+    return parts[1], int(parts[2])
+
+def describe_player(sport: str, record: dict) -> str:
+    if not record:
+        return ""
+    if sport == "MLB":
+        return record.get("primaryPosition", {}).get("abbreviation", "")
+    elif sport == "NFL":
+        return ", ".join(str(record[key]) for key in ("position", "team") if isinstance(record.get(key), str))
+    return ""
+
+def player_choice(sport: str, player_index: PlayerIndex, player_id, show_sport: bool) -> app_commands.Choice:
+    details = describe_player(sport, player_index.get(player_id))
+    details = ", ".join(filter(None, (sport if show_sport else "", details)))
+    label = f"{player_index.names[player_id]} ({details})" if details else player_index.names[player_id]
+    return app_commands.Choice(name=label[:100], value=encode_player_choice(sport, player_id))
+
+def complete_player_name(sport: str, current: str) -> list:
+    choice = decode_player_choice(current)
+    if choice:
+        player_sport, player_id = choice
+        player_index = peek_player_index(player_sport)
+        if player_index is not None and player_id in player_index:
+            return [player_choice(player_sport, player_index, player_id, sport is None)]
+        return []
+    
+    sports = [sport] if sport else SPORTS
+    results = []
+    for player_sport in sports:
+        player_index = peek_player_index(player_sport)
+        if player_index is None:
+            continue
+        results.append([(player_sport, player_index, match) for match in player_index.complete(current, n=AUTOCOMPLETE_LIMIT)])
+    
+    # Sports are interleaved, but a prefix hit in one sport always ranks
+    # above a fuzzy fill from another.
+    query = normalize_name(current)
+    merged = sorted(
+        filter(None, chain.from_iterable(zip_longest(*results))),
+        key=lambda result: completion_rank(query, result[2])
+    )
+    return [
+        player_choice(player_sport, player_index, match.player_id, sport is None)
+        for player_sport, player_index, match in merged[:AUTOCOMPLETE_LIMIT]
+    ]
+
+def completion_rank(query: str, match) -> tuple:
+    key = normalize_name(match.name)
+    if key.startswith(query):
+        return (0, 0.0)
+    if f" {query}" in f" {key}":
+        return (1, 0.0)
+    return (2, -match.score)
 
 class PlayerSelect(discord.ui.View):
     def __init__(self, matches: list, sport: str):
         super().__init__(timeout=30)
-        self.matches = matches
+        self.matches = matches[:3]
         self.sport = sport
+        self.prefetch_task = None
         
-        for i, player_name in enumerate(matches[:3]):
-            button = discord.ui.Button(label=player_name, custom_id=f"player_{i}", style=discord.ButtonStyle.primary, row=0)
-            button.callback = self.create_callback(player_name)
+        for i, match in enumerate(self.matches):
+            button = discord.ui.Button(label=match.name, custom_id=f"player_{i}", style=discord.ButtonStyle.primary, row=0)
+            button.callback = self.create_callback(match)
             self.add_item(button)
     
-    def create_callback(self, player_name: str):
+    def start_prefetch(self):
+        if self.prefetch_task is None:
+            self.prefetch_task = asyncio.create_task(
+                prefetch_player_stats(self.sport, [match.player_id for match in self.matches])
+            )
+    
+    async def on_timeout(self):
+        # Fetches only the prefetch is waiting on are cancelled with it.
+        if self.prefetch_task is not None:
+            self.prefetch_task.cancel()
+    
+    def create_callback(self, match):
         async def callback(interaction: discord.Interaction):
             for item in self.children:
                 item.disabled = True
             await interaction.response.edit_message(view=self)
             
             try:
-                if self.sport == "NBA":
-                    stats = await get_nba_stats(player_name, fuzzy_match=False)
-                elif self.sport == "NFL":
-                    stats = await get_nfl_stats(player_name, fuzzy_match=False)
-                elif self.sport == "MLB":
-                    stats = await get_mlb_stats(player_name, fuzzy_match=False)
-                else:
-                    pass
+                # Usually already cached by the prefetch, or joins its
+                # in-flight request for this player.
+                stats = await get_player_stats(self.sport, match.player_id)
                 if not stats:
-                    await interaction.followup.send(f"Could not find stats for {player_name}.", ephemeral=True)
+                    await interaction.followup.send(f"Could not find stats for {match.name}.", ephemeral=True)
                     return
                 
                 em = create_stats_embed(stats, self.sport)
@@ -88,6 +351,39 @@ class PlayerSelect(discord.ui.View):
         
         return callback
 
+class StatsPages(discord.ui.View):
+    def __init__(self, embeds: list):
+        super().__init__(timeout=120)
+        self.embeds = embeds
+        self.page = 0
+        
+        for i, em in enumerate(embeds):
+            page = f"Page {i + 1}/{len(embeds)}"
+            em.set_footer(text=f"{page} | {em.footer.text}" if em.footer.text else page)
+    
+    async def show(self, interaction: discord.Interaction, page: int):
+        self.page = page % len(self.embeds)
+        await interaction.response.edit_message(embed=self.embeds[self.page], view=self)
+    
+    @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary)
+    async def previous(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show(interaction, self.page - 1)
+    
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary)
+    async def next(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show(interaction, self.page + 1)
+
+async def send_player_stats(interaction: discord.Interaction, stats: dict, sport: str):
+    if not stats:
+        await interaction.followup.send("Could not retrieve stats at this time. Please try again later.", ephemeral=True)
+        return
+    
+    em = create_stats_embed(stats, sport)
+    if em:
+        await interaction.followup.send(embed=em)
+    else:
+        await interaction.followup.send("Stats not available for this player.", ephemeral=True)
+
 def create_stats_embed(stats: dict, sport: str) -> discord.Embed:
     polarpickscolor = 0xd6e1ff
     em = discord.Embed(title=f"{stats['name']} - {sport} Stats", color=polarpickscolor)
@@ -185,266 +481,451 @@ def create_stats_embed(stats: dict, sport: str) -> discord.Embed:
     em.set_footer(text=f"Last Updated: {datetime.now(pytz.timezone('EST')).strftime('%Y-%m-%d %H:%M:%S EST')}")
     return em
 
-async def get_nba_stats(player_name: str, fuzzy_match: bool = True) -> dict:
-    cache_key = player_name.lower()
+async def fetch_nba_stats(player: dict) -> dict:
+    season = nba_season()
+    
+    stats_data = await providers.run(
+        "NBA",
+        nba_dashboard.defer("PlayerDashboardByYearOverYear"),
+        player_id=player['id'],
+        per_mode_detailed="PerGame",
+        season=season
+    )
+    
+    current_stats = stats_data.get_data_frames()[0]
     
-    if cache_key in nba_cache:
-        return nba_cache[cache_key]
+    if current_stats.empty:
+        return None
         
-    try:
-        all_players = nba_players.get_players()
-        player_names = [p['full_name'].lower() for p in all_players]
+    return {
+        'name': player['full_name'],
+        'pts': round(float(current_stats['PTS'].iloc[0]), 1),
+        'reb': round(float(current_stats['REB'].iloc[0]), 1),
+        'ast': round(float(current_stats['AST'].iloc[0]), 1),
+        'stl': round(float(current_stats['STL'].iloc[0]), 1),
+        'blk': round(float(current_stats['BLK'].iloc[0]), 1),
+        'tov': round(float(current_stats['TOV'].iloc[0]), 1),
+        'min': round(float(current_stats['MIN'].iloc[0]), 1)
+    }
+
+def mlb_stat_group(player: dict) -> str:
+    return "pitching" if player.get("primaryPosition", {}).get("abbreviation", "") == "P" else "hitting"
+
+def build_mlb_stats(player: dict, raw: dict) -> dict:
+    group = mlb_stat_group(player)
+    for entry in raw.get("stats", []):
+        if entry.get("group") == group and entry.get("stats"):
+            return {
+                "name": player["fullName"],
+                "team": player["currentTeam"]["id"],
+                "position": player.get("primaryPosition", {}).get("abbreviation", ""),
+                "stats": entry["stats"]
+            }
+    return None
+
+async def fetch_mlb_stats(player: dict) -> dict:
+    raw = await mlb_api.player_stats(player['id'], group=mlb_stat_group(player))
+    return build_mlb_stats(player, raw) if raw else None
+
+async def prefetch_mlb_stats(player_ids: list):
+    cache = state.stats_caches["MLB"]
+    missing = [pid for pid in dict.fromkeys(player_ids) if cache.lookup(str(pid), count=False)[0] is None]
+    if len(missing) < 2:
+        return
+    
+    directory = get_mlb_directory()
+    raw_stats = await mlb_api.season_stats(missing)
+    for player_id in missing:
+        player = directory.get(player_id)
+        raw = raw_stats.get(player_id)
+        if player is None or raw is None:
+            continue
+        stats = build_mlb_stats(player, raw)
+        await cache_stats("MLB", str(player_id), stats or {}, ttl=None if stats else NEGATIVE_TTL)
+
+async def fetch_nfl_stats(season_data: NFLSeasonData, player: dict) -> dict:
+    position = player['position'].upper()
+    stats = {
+        'name': player['player_name'],
+        'position': position
+    }
+    
+    if position in ['RG', 'LG', 'RT', 'LT', 'C']:
+        return stats
         
-        close_matches = get_close_matches(player_name.lower(), player_names, n=3, cutoff=0.6)
+    player_totals = season_data.player_totals(player['player_id'])
+    if player_totals is None:
+        return None
         
-        if not close_matches:
-            return None
-            
-        best_match = close_matches[0]
-        player = next(p for p in all_players if p['full_name'].lower() == best_match)
+    def total(column):
+        return player_totals.get(column, 0)
         
-        player_id = player['id']
+    if position == 'QB':
+        completions = total('completions')
+        attempts = total('attempts')
+        stats.update({
+            'completions': int(completions),
+            'attempts': int(attempts),
+            'completion_pct': round(completions / attempts * 100, 1) if attempts > 0 else 0,
+            'pass_yards': int(total('passing_yards')),
+            'rush_yards': int(total('rushing_yards')),
+            'touchdowns': int(total('passing_tds') + total('rushing_tds')),
+            'interceptions': int(total('interceptions')),
+            'fumbles': int(total('fumbles'))
+        })
         
-        current_year = datetime.now().year
-        if datetime.now().month < 8:
-            current_year -= 1
-        season = f"{current_year}-{str(current_year + 1)[2:]}"
+    elif position in ['WR', 'TE']:
+        stats.update({
+            'receptions': int(total('receptions')),
+            'rec_yards': int(total('receiving_yards')),
+            'touchdowns': int(total('receiving_tds')),
+            'targets': int(total('targets')),
+            'drops': int(total('drops')),
+            'fumbles': int(total('fumbles'))
+        })
         
-        stats_data = playerdashboardbyyearoveryear.PlayerDashboardByYearOverYear(
-            player_id=player_id,
-            per_mode_detailed="PerGame",
-            season=season
-        )
+    elif position in ['RB', 'FB']:
+        stats.update({
+            'rush_yards': int(total('rushing_yards')),
+            'carries': int(total('carries')),
+            'rush_tds': int(total('rushing_tds')),
+            'rec_yards': int(total('receiving_yards')),
+            'rec_tds': int(total('receiving_tds')),
+            'targets': int(total('targets')),
+            'drops': int(total('drops')),
+            'fumbles': int(total('fumbles'))
+        })
         
-        current_stats = stats_data.get_data_frames()[0]
+    elif position in ['DT', 'DE', 'LB', 'CB', 'S']:
+        stats.update({
+            'tackles': int(total('tackles')),
+            'sacks': float(total('sacks')),
+            'interceptions': int(total('interceptions')),
+            'passes_defended': int(total('passes_defended')),
+            'forced_fumbles': int(total('forced_fumbles')),
+            'fumbles_recovered': int(total('fumbles_recovered'))
+        })
         
-        if current_stats.empty:
-            return None
-            
-        stats = {
-            'name': player['full_name'],
-            'pts': round(float(current_stats['PTS'].iloc[0]), 1),
-            'reb': round(float(current_stats['REB'].iloc[0]), 1),
-            'ast': round(float(current_stats['AST'].iloc[0]), 1),
-            'stl': round(float(current_stats['STL'].iloc[0]), 1),
-            'blk': round(float(current_stats['BLK'].iloc[0]), 1),
-            'tov': round(float(current_stats['TOV'].iloc[0]), 1),
-            'min': round(float(current_stats['MIN'].iloc[0]), 1),
-            'close_matches': close_matches[1:] if len(close_matches) > 1 else []
-        }
+    elif position == 'K':
+        stats.update({
+            'fg_made': int(total('field_goals_made')),
+            'fg_attempts': int(total('field_goals_attempted')),
+            'xp_made': int(total('extra_points_made')),
+            'xp_attempts': int(total('extra_points_attempted'))
+        })
         
-        nba_cache[cache_key] = stats
-        return stats
-    except Exception as e:
-        try:
-            owner = await bot.fetch_user(OWNER_ID)
-            await owner.send(f"Error fetching NBA stats for {player_name}: {str(e)}")
-        except:
-            pass
-        print(f"Error fetching NBA stats: {str(e)}")
+    return stats
+
+async def fetch_player_stats(sport: str, cache_key: str) -> dict:
+    player_id = cache_key if sport == "NFL" else int(cache_key)
+    player_index = await get_player_index(sport)
+    player = player_index.get(player_id)
+    if player is None:
         return None
+    
+    if sport == "NBA":
+        return await fetch_nba_stats(player)
+    elif sport == "NFL":
+        return await fetch_nfl_stats(await get_nfl_season(current_season_year()), player)
+    elif sport == "MLB":
+        return await fetch_mlb_stats(player)
 
-async def get_mlb_stats(player_name: str, fuzzy_match: bool = True) -> dict:
-    cache_key = player_name.lower()
+async def load_player_stats(sport: str, cache_key: str) -> dict:
+    stats = await fetch_player_stats(sport, cache_key)
+    if stats:
+        await cache_stats(sport, cache_key, stats)
+    else:
+        await cache_stats(sport, cache_key, {}, ttl=NEGATIVE_TTL)
+    return stats
 
-    if cache_key in mlb_cache:
-        return mlb_cache[cache_key]
+async def get_player_stats(sport: str, player_id, use_cache: bool = True, speculative: bool = False) -> dict:
+    cache_key = str(player_id)
     
-    try:
-        all_players = load_player_cache()
-        player_names = [p['fullName'].lower() for p in all_players]
+    if use_cache:
+        cached = await get_cached_stats(sport, cache_key)
+        if cached is not None:
+            return cached or None
+    
+    join = inflight.do_speculative if speculative else inflight.do
+    return await join((sport, cache_key), load_player_stats, sport, cache_key)
 
-        close_matches = get_close_matches(player_name.lower(), player_names, n=3, cutoff=0.6)
-        
-        if not close_matches:
-            return None
-        
-        best_match = close_matches[0]
-        player = next(p for p in all_players if p['fullName'].lower() == best_match)
-        playerid = player['id']
-        pos = player.get("primaryPosition", {}).get("abbreviation", "")
-        group = "pitching" if pos == "P" else "hitting"
-        raw = mlbstats.player_stat_data(playerid, group=group, type="season")
-
-        if raw.get("stats") and raw["stats"][0].get("stats"):
-            stat_obj = raw["stats"][0]["stats"]
-            result = {
-            "name": player["fullName"],
-            "team": player["currentTeam"]["id"],
-            "position": pos,
-            "stats": stat_obj,
-            "close_matches": close_matches[1:] if len(close_matches) > 1 else []
-            }
-            mlb_cache[cache_key] = result
-            return result
-        else:
-            return None
-    except Exception as e:
-        print(f"Error fetching MLB stats: {str(e)}")
-        return None
+def parse_player_list(players: str, default_sport: str = None) -> list:
+    entries = []
+    for raw in re.split(r"[,;\n]", players):
+        player_name = raw.strip()
+        if not player_name:
+            continue
+        sport = default_sport
+        prefix, sep, rest = player_name.partition(":")
+        if sep and prefix.strip().upper() in SPORTS:
+            sport, player_name = prefix.strip().upper(), rest.strip()
+        if player_name:
+            entries.append((sport, player_name))
+    return entries
 
-async def get_nfl_stats(player_name: str, fuzzy_match: bool = True) -> dict:
-    cache_key = player_name.lower()
+async def resolve_any(sport: str, player_name: str):
+    sports = [sport] if sport else SPORTS
+    results = await asyncio.gather(*(resolve_player(s, player_name) for s in sports), return_exceptions=True)
     
-    if cache_key in nfl_cache:
-        return nfl_cache[cache_key]
-        
+    best = None
+    for player_sport, matches in zip(sports, results):
+        if isinstance(matches, Exception) or not matches:
+            continue
+        if best is None or matches[0].score > best[1].score:
+            best = (player_sport, matches[0])
+    return best
+
+async def prefetch_player_stats(sport: str, player_ids: list):
+    if sport == "MLB":
+        async with prefetch_budget:
+            try:
+                await prefetch_mlb_stats(player_ids)
+            except Exception as e:
+                print(f"Error prefetching MLB stats: {e}")
+    
+    async def prefetch(player_id):
+        async with prefetch_budget:
+            await get_player_stats(sport, player_id, speculative=True)
+    
+    await asyncio.gather(*(prefetch(player_id) for player_id in player_ids), return_exceptions=True)
+
+async def build_leader_tables(sport: str) -> dict:
+    if sport == "NBA":
+        season = nba_season()
+        frames = await asyncio.gather(*(
+            providers.run("NBA", fetch_nba_league_dash, season, position, timeout=60) for position in ("", "G", "F", "C")
+        ))
+        positions = {}
+        for position, frame in zip(("G", "F", "C"), frames[1:]):
+            for player_id in frame["PLAYER_ID"]:
+                positions[player_id] = f"{positions[player_id]}-{position}" if player_id in positions else position
+        tables = {"NBA": await providers.run("NBA", build_nba_table, frames[0], positions)}
+    elif sport == "NFL":
+        season_data = await get_nfl_season(current_season_year())
+        tables = {"NFL": await providers.run("NFL", build_nfl_table, season_data.roster, season_data.totals)}
+    else:
+        directory = await ensure_mlb_directory()
+        raw_stats = await mlb_api.season_stats(list(directory.by_id))
+        tables = await providers.run("MLB", build_mlb_tables, directory.players, raw_stats)
+    
+    for name, table in tables.items():
+        state.leader_tables[name] = table
+        try:
+            await providers.run("STORE", table.save, table_path(name))
+        except Exception as e:
+            print(f"Error saving {name} leader table: {e}")
+    return tables
+
+def schedule_leader_refresh(sport: str):
+    key = ("leaders", sport)
+    if key in refresh_tasks:
+        return
+    
+    def finish(task):
+        refresh_tasks.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Error refreshing {sport} leader tables: {task.exception()}")
+    
+    task = asyncio.create_task(inflight.do(key, build_leader_tables, sport))
+    refresh_tasks[key] = task
+    task.add_done_callback(finish)
+
+async def get_leader_table(name: str):
+    sport = name.split("-")[0]
+    table = state.leader_tables.get(name)
+    if table is None:
+        table = await providers.run("STORE", load_table, name)
+        if table is not None:
+            state.leader_tables[name] = table
+    if table is None:
+        tables = await inflight.do(("leaders", sport), build_leader_tables, sport)
+        return tables.get(name)
+    
+    # Serve the materialized table and rebuild it in the background once stale.
+    if time.time() - table.built_at > LEADER_TTL:
+        schedule_leader_refresh(sport)
+    return table
+
+async def get_bulk_stats(entries: list, concurrency: int = BULK_CONCURRENCY) -> list:
+    budget = asyncio.Semaphore(concurrency)
+    
+    async def resolve(sport: str, player_name: str):
+        async with budget:
+            return await resolve_any(sport, player_name)
+    
+    resolved = await asyncio.gather(*(resolve(*entry) for entry in entries), return_exceptions=True)
+    resolved = [None if isinstance(result, Exception) else result for result in resolved]
+    
+    # Every MLB player in the request is hydrated in one personIds call
+    # instead of one request per player.
     try:
-        current_year = datetime.now().year
-        if datetime.now().month < 8:
-            current_year -= 1
-            
-        player_stats = nfl.import_seasonal_rosters([current_year])
-        weekly_stats = nfl.import_weekly_data([current_year])
-        
-        player_names = player_stats['player_name'].str.lower().tolist()
-        
-        close_matches = get_close_matches(player_name.lower(), player_names, n=3, cutoff=0.6)
-        
-        if not close_matches:
-            return None
-            
-        best_match = close_matches[0]
-        player = player_stats[player_stats['player_name'].str.lower() == best_match].iloc[0]
-        position = player['position'].upper()
-        
-        if position in ['RG', 'LG', 'RT', 'LT', 'C']:
-            result = {
-                'name': player['player_name'], 
-                'position': position,
-                'close_matches': close_matches[1:] if len(close_matches) > 1 else []
-            }
-            nfl_cache[cache_key] = result
-            return result
-            
-        player_weekly = weekly_stats[weekly_stats['player_id'] == player['player_id']]
-        if player_weekly.empty:
-            return None
-            
-        def safe_sum(df, column):
-            if column in df.columns:
-                return df[column].sum()
-            return 0
-            
-        stats = {
-            'name': player['player_name'],
-            'position': position,
-            'close_matches': close_matches[1:] if len(close_matches) > 1 else []
-        }
-        
-        if position == 'QB':
-            completions = safe_sum(player_weekly, 'completions')
-            attempts = safe_sum(player_weekly, 'attempts')
-            stats.update({
-                'completions': int(completions),
-                'attempts': int(attempts),
-                'completion_pct': round(completions / attempts * 100, 1) if attempts > 0 else 0,
-                'pass_yards': int(safe_sum(player_weekly, 'passing_yards')),
-                'rush_yards': int(safe_sum(player_weekly, 'rushing_yards')),
-                'touchdowns': int(safe_sum(player_weekly, 'passing_tds') + safe_sum(player_weekly, 'rushing_tds')),
-                'interceptions': int(safe_sum(player_weekly, 'interceptions')),
-                'fumbles': int(safe_sum(player_weekly, 'fumbles'))
-            })
-            
-        elif position in ['WR', 'TE']:
-            stats.update({
-                'receptions': int(safe_sum(player_weekly, 'receptions')),
-                'rec_yards': int(safe_sum(player_weekly, 'receiving_yards')),
-                'touchdowns': int(safe_sum(player_weekly, 'receiving_tds')),
-                'targets': int(safe_sum(player_weekly, 'targets')),
-                'drops': int(safe_sum(player_weekly, 'drops')),
-                'fumbles': int(safe_sum(player_weekly, 'fumbles'))
-            })
-            
-        elif position in ['RB', 'FB']:
-            stats.update({
-                'rush_yards': int(safe_sum(player_weekly, 'rushing_yards')),
-                'carries': int(safe_sum(player_weekly, 'carries')),
-                'rush_tds': int(safe_sum(player_weekly, 'rushing_tds')),
-                'rec_yards': int(safe_sum(player_weekly, 'receiving_yards')),
-                'rec_tds': int(safe_sum(player_weekly, 'receiving_tds')),
-                'targets': int(safe_sum(player_weekly, 'targets')),
-                'drops': int(safe_sum(player_weekly, 'drops')),
-                'fumbles': int(safe_sum(player_weekly, 'fumbles'))
-            })
-            
-        elif position in ['DT', 'DE', 'LB', 'CB', 'S']:
-            stats.update({
-                'tackles': int(safe_sum(player_weekly, 'tackles')),
-                'sacks': float(safe_sum(player_weekly, 'sacks')),
-                'interceptions': int(safe_sum(player_weekly, 'interceptions')),
-                'passes_defended': int(safe_sum(player_weekly, 'passes_defended')),
-                'forced_fumbles': int(safe_sum(player_weekly, 'forced_fumbles')),
-                'fumbles_recovered': int(safe_sum(player_weekly, 'fumbles_recovered'))
-            })
-            
-        elif position == 'K':
-            stats.update({
-                'fg_made': int(safe_sum(player_weekly, 'field_goals_made')),
-                'fg_attempts': int(safe_sum(player_weekly, 'field_goals_attempted')),
-                'xp_made': int(safe_sum(player_weekly, 'extra_points_made')),
-                'xp_attempts': int(safe_sum(player_weekly, 'extra_points_attempted'))
-            })
-            
-        nfl_cache[cache_key] = stats
-        return stats
-        
+        await prefetch_mlb_stats([match.player_id for player_sport, match in filter(None, resolved) if player_sport == "MLB"])
     except Exception as e:
-        try:
-            owner = await bot.fetch_user(OWNER_ID)
-            await owner.send(f"Error fetching NFL stats for {player_name}: {str(e)}")
-        except:
-            pass
-        print(f"Error fetching NFL stats: {str(e)}")
-        return None
+        print(f"Error prefetching MLB stats: {e}")
+    
+    async def lookup(resolved_entry):
+        if resolved_entry is None:
+            return None, None
+        player_sport, match = resolved_entry
+        async with budget:
+            return player_sport, await get_player_stats(player_sport, match.player_id)
+    
+    results = await asyncio.gather(*(lookup(entry) for entry in resolved), return_exceptions=True)
+    return [(None, None) if isinstance(result, Exception) else result for result in results]
 
 async def fetch_odds(sport: str, fuzzy_match: bool = True) -> dict:
-    if sport == "NBA":
-        pass
-    if sport == "MLB":
-        pass
-    if sport == "NFL":
-        pass
+    if sport not in odds_books:
+        return None
+    return odds_books[sport].snapshot()
 
 class Stats(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+    async def cog_load(self):
+        global stats_store, mlb_api
+        stats_store = StatsStore()
+        mlb_api = MLBStatsClient()
+        self.preload_task = asyncio.create_task(self.preload_mlb_directory())
+        if not state.warmed:
+            try:
+                await warm_caches()
+                state.warmed = True
+            except Exception as e:
+                print(f"Error warming stats caches: {e}")
+        self.refresh_nfl_data.start()
+        self.refresh_hot_players.start()
+
+    async def preload_mlb_directory(self):
+        try:
+            mlb_directory = await ensure_mlb_directory()
+            print(f"Loaded {len(mlb_directory)} MLB players.")
+        except Exception as e:
+            print(f"Error loading MLB player directory: {e}")
+
+    async def cog_unload(self):
+        self.refresh_nfl_data.cancel()
+        self.refresh_hot_players.cancel()
+        for task in list(refresh_tasks.values()) + list(index_tasks.values()):
+            task.cancel()
+        providers.shutdown()
+        stats_store.close()
+        await mlb_api.close()
+
+    @tasks.loop(hours=1)
+    async def refresh_nfl_data(self):
+        for season, season_data in list(state.nfl_seasons.items()):
+            try:
+                changed = await providers.run("NFL", season_data.refresh, timeout=300)
+                state.nfl_indexes[season] = await providers.run("NFL", build_nfl_index, season_data.roster)
+                state.name_caches["NFL"].clear()
+                if changed:
+                    state.stats_caches["NFL"].clear()
+                    await providers.run("STORE", stats_store.delete_stats, "NFL")
+                    if "NFL" in state.leader_tables:
+                        schedule_leader_refresh("NFL")
+                    print(f"NFL {season} data refreshed through week {season_data.last_week}")
+            except Exception as e:
+                print(f"Error refreshing NFL {season} data: {e}")
+
+    @refresh_nfl_data.before_loop
+    async def before_refresh_nfl_data(self):
+        await self.bot.wait_until_ready()
+
+    @tasks.loop(minutes=1)
+    async def refresh_hot_players(self):
+        for sport, cache in state.stats_caches.items():
+            for cache_key in cache.hottest(HOT_PLAYERS):
+                if cache_key in cache and cache.expires_in(cache_key) < HOT_REFRESH_WINDOW:
+                    schedule_refresh(sport, cache_key)
+            cache.decay()
+
+    @refresh_hot_players.before_loop
+    async def before_refresh_hot_players(self):
+        await self.bot.wait_until_ready()
+
     @app_commands.command(
             name="buildjson",
             description="buildjson"
     )
     async def _buildjson(self, interaction: discord.Interaction):
         await interaction.response.defer()
-        generate_player_dump()
-        players = mlbstats.lookup_player("")
+        players = await generate_player_dump()
+        await providers.run("MLB", load_mlb_directory)
+        state.name_caches["MLB"].clear()
+        state.stats_caches["MLB"].clear()
+        await providers.run("STORE", stats_store.delete_stats, "MLB")
+        await providers.run("STORE", stats_store.put_players, "MLB", [(p['id'], p['fullName'], p) for p in players])
         print(f"Fetched {len(players)} total players.")
-        await interaction.followup.send("Done.", emphemeral=True)
+        await interaction.followup.send("Done.", ephemeral=True)
     
-    @app_commands.command(name="stats", description="Get season stats for a specific player")
+    @app_commands.command(name="multistats", description="Get season stats for several players at once")
+    @app_commands.describe(
+        players="Comma separated player names, optionally prefixed with a sport (e.g. NBA: LeBron James)",
+        sport="Sport to use for names without a prefix"
+    )
     @app_commands.choices(sport=[
         app_commands.Choice(name="NBA", value="NBA"),
         app_commands.Choice(name="NFL", value="NFL"),
         app_commands.Choice(name="MLB", value="MLB")
     ])
-    async def stats(self, interaction: discord.Interaction, sport: app_commands.Choice[str], player_name: str):
+    async def multistats(self, interaction: discord.Interaction, players: str, sport: app_commands.Choice[str] = None):
         await interaction.response.defer()
         
+        entries = parse_player_list(players, sport.value if sport else None)
+        if not entries:
+            await interaction.followup.send("Please provide at least one player name.", ephemeral=True)
+            return
+        entries = entries[:BULK_MAX_PLAYERS]
+        
         try:
-            if sport.value == "NBA":
-                all_players = nba_players.get_players()
-                player_names = [p['full_name'].lower() for p in all_players]
-            elif sport.value == "NFL":
-                current_year = datetime.now().year
-                if datetime.now().month < 8:
-                    current_year -= 1
-                player_stats = nfl.import_seasonal_rosters([current_year])
-                player_names = player_stats['player_name'].str.lower().tolist()
-            elif sport.value == "MLB":
-                player_names = [p['fullName'].lower() for p in mlb_players]
+            results = await get_bulk_stats(entries)
+            
+            embeds = []
+            missing = []
+            for (_, player_name), (player_sport, stats) in zip(entries, results):
+                em = create_stats_embed(stats, player_sport) if stats else None
+                if em:
+                    embeds.append(em)
+                else:
+                    missing.append(player_name)
+            
+            if missing:
+                em = discord.Embed(title="No Stats Found", color=0xd6e1ff)
+                em.description = "\n".join(missing)
+                embeds.append(em)
+            
+            if len(embeds) > 1:
+                await interaction.followup.send(embed=embeds[0], view=StatsPages(embeds))
             else:
+                await interaction.followup.send(embed=embeds[0])
+        
+        except Exception as e:
+            try:
+                owner = await self.bot.fetch_user(OWNER_ID)
+                await owner.send(f"Error in multistats command for {players}: {str(e)}")
+            except:
                 pass
-            matches = get_close_matches(player_name.lower(), player_names, n=5, cutoff=0.6)
+            print(f"Error in multistats command: {str(e)}")
+            await interaction.followup.send("Could not retrieve stats at this time. Please try again later.", ephemeral=True)
+
+    @app_commands.command(name="stats", description="Get season stats for a specific player")
+    @app_commands.choices(sport=[
+        app_commands.Choice(name="NBA", value="NBA"),
+        app_commands.Choice(name="NFL", value="NFL"),
+        app_commands.Choice(name="MLB", value="MLB")
+    ])
+    async def stats(self, interaction: discord.Interaction, sport: app_commands.Choice[str], player_name: str):
+        await interaction.response.defer()
+        
+        try:
+            choice = decode_player_choice(player_name)
+            if choice:
+                player_sport, player_id = choice
+                await send_player_stats(interaction, await get_player_stats(player_sport, player_id), player_sport)
+                return
+            
+            matches = await resolve_player(sport.value, player_name)
             
             if not matches:
                 await interaction.followup.send(f"Could not find any {sport.value} player matching: {player_name}. Please check the spelling.", ephemeral=True)
@@ -452,7 +933,7 @@ class Stats(commands.Cog):
                 
             exact_match = None
             for match in matches:
-                if player_name.lower() in match.lower():
+                if player_name.lower() in match.name.lower():
                     if exact_match is None:
                         exact_match = match
                     else:
@@ -461,23 +942,8 @@ class Stats(commands.Cog):
             
             if exact_match or len(matches) == 1:
                 player_to_use = exact_match or matches[0]
-                if sport.value == "NBA":
-                    stats = await get_nba_stats(player_to_use, fuzzy_match=False)
-                elif sport.value == "NFL":
-                    stats = await get_nfl_stats(player_to_use, fuzzy_match=False)
-                elif sport.value == "MLB":
-                    stats = await get_mlb_stats(player_to_use, fuzzy_match=False)
-                else:
-                    pass
-                if not stats:
-                    await interaction.followup.send("Could not retrieve stats at this time. Please try again later.", ephemeral=True)
-                    return
-                    
-                em = create_stats_embed(stats, sport.value)
-                if em:
-                    await interaction.followup.send(embed=em)
-                else:
-                    await interaction.followup.send("Stats not available for this player.", ephemeral=True)
+                stats = await get_player_stats(sport.value, player_to_use.player_id)
+                await send_player_stats(interaction, stats, sport.value)
             else:
                 em = discord.Embed(
                     title="Multiple Players Found",
@@ -486,6 +952,7 @@ class Stats(commands.Cog):
                 )
                 view = PlayerSelect(matches, sport.value)
                 await interaction.followup.send(embed=em, view=view)
+                view.start_prefetch()
             
         except Exception as e:
             try:
@@ -496,5 +963,72 @@ class Stats(commands.Cog):
             print(f"Error in stats command: {str(e)}")
             await interaction.followup.send("Could not retrieve stats at this time. Please try again later.", ephemeral=True)
 
+    @stats.autocomplete("player_name")
+    async def player_name_autocomplete(self, interaction: discord.Interaction, current: str) -> list:
+        sport = getattr(interaction.namespace, "sport", None)
+        with metrics.timer("autocomplete_seconds", sport=sport or "all"):
+            return complete_player_name(sport if sport in SPORTS else None, current)
+
+    @app_commands.command(name="leaders", description="Get the season leaders for a stat")
+    @app_commands.describe(
+        stat="Stat to rank players by",
+        position="Only include these positions, comma separated (e.g. RB or WR,TE)",
+        count="Number of players to show"
+    )
+    @app_commands.choices(sport=[
+        app_commands.Choice(name="NBA", value="NBA"),
+        app_commands.Choice(name="NFL", value="NFL"),
+        app_commands.Choice(name="MLB", value="MLB")
+    ])
+    async def leaders(self, interaction: discord.Interaction, sport: app_commands.Choice[str], stat: str,
+                      position: str = None, count: app_commands.Range[int, 1, LEADER_LIMIT] = 10):
+        await interaction.response.defer()
+        
+        leader_stat = LEADER_STATS[sport.value].get(stat.lower())
+        if leader_stat is None:
+            stats_list = ", ".join(LEADER_STATS[sport.value])
+            await interaction.followup.send(f"Unknown {sport.value} stat: {stat}. Try one of: {stats_list}", ephemeral=True)
+            return
+        
+        try:
+            table = await get_leader_table(leader_stat.table)
+            positions = [p for p in re.split(r"[,\s/]+", position) if p] if position else None
+            with metrics.timer("leaders_query_seconds", sport=sport.value):
+                leaders = table.top(leader_stat.column, count, positions, leader_stat.ascending, leader_stat.qualifier) if table else []
+            
+            if not leaders:
+                await interaction.followup.send(f"No qualified {sport.value} players found for {leader_stat.label}.", ephemeral=True)
+                return
+            
+            em = discord.Embed(title=f"{sport.value} Leaders - {leader_stat.label}", color=0xd6e1ff)
+            em.description = "\n".join(
+                f"**{rank}.** {leader.name} ({leader.position}) - {format_leader_value(leader.value, leader_stat.decimals)}"
+                for rank, leader in enumerate(leaders, 1)
+            )
+            updated = datetime.fromtimestamp(table.built_at, pytz.timezone('EST')).strftime('%Y-%m-%d %H:%M EST')
+            em.set_footer(text=f"Positions: {position.upper()} | Updated {updated}" if positions else f"Updated {updated}")
+            await interaction.followup.send(embed=em)
+        
+        except Exception as e:
+            print(f"Error in leaders command: {str(e)}")
+            await interaction.followup.send("Could not retrieve leaders at this time. Please try again later.", ephemeral=True)
+
+    @leaders.autocomplete("stat")
+    async def stat_autocomplete(self, interaction: discord.Interaction, current: str) -> list:
+        sport = getattr(interaction.namespace, "sport", None)
+        sports = [sport] if sport in LEADER_STATS else SPORTS
+        current = current.lower()
+        choices = []
+        for stat_sport in sports:
+            for key, leader_stat in LEADER_STATS[stat_sport].items():
+                if current in key or current in leader_stat.label.lower():
+                    label = leader_stat.label if len(sports) == 1 else f"{leader_stat.label} ({stat_sport})"
+                    choices.append(app_commands.Choice(name=label, value=key))
+        return choices[:AUTOCOMPLETE_LIMIT]
+
 async def setup(bot):
+    global state
+    state, reused = get_registry(bot).acquire("stats", STATS_STATE_VERSION, StatsState)
+    if reused:
+        print("Reusing warm stats caches and player indexes.")
     await bot.add_cog(Stats(bot)) 
\ No newline at end of file
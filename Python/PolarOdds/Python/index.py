@@ -2,13 +2,30 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import asyncio
+import contextvars
 import os
+import time
 from datetime import datetime
 import pytz
 from config import TOKEN
+from utils.treesync import sync_tree
+from utils.metrics import InstrumentedTree
+
+# Timing entry for the extension being loaded in the current task.
+extension_timing = contextvars.ContextVar("extension_timing", default=None)
+
+class TimedBot(commands.Bot):
+    async def add_cog(self, cog, /, **kwargs):
+        timing = extension_timing.get()
+        start = time.perf_counter()
+        try:
+            await super().add_cog(cog, **kwargs)
+        finally:
+            if timing is not None:
+                timing["setup"] = timing.get("setup", 0.0) + time.perf_counter() - start
 
 intents = discord.Intents().all()
-bot = commands.Bot(command_prefix='-', intents=intents)
+bot = TimedBot(command_prefix='-', intents=intents, tree_cls=InstrumentedTree)
 
 bot.remove_command("help")
 
@@ -17,34 +34,53 @@ botid = 1338579705628201061
 guildid = 1338581149374480496
 
 commands_synced = False
+startup_timings = {}
+
+dev_guild = discord.Object(id=guildid)
+
+async def sync_commands(dev: bool = False, force: bool = False) -> bool:
+    if dev:
+        bot.tree.copy_global_to(guild=dev_guild)
+        return await sync_tree(bot.tree, guild=dev_guild, force=force)
+    return await sync_tree(bot.tree, force=force)
 
 @bot.event
 async def on_ready():
     global commands_synced
     if not commands_synced:
         print("Syncing commands...")
+        start = time.perf_counter()
         try:
-            await bot.tree.sync()
-            print("Commands synced successfully!")
+            if await sync_commands():
+                print("Commands synced successfully!")
+            else:
+                print("Commands unchanged, skipped sync.")
             commands_synced = True
         except Exception as e:
             print(f"Failed to sync commands: {e}")
+        startup_timings["sync"] = time.perf_counter() - start
+        print_startup_report()
     
     print(f"{bot.user} is ready!")
 
 @bot.tree.command(name="sync", description="Owner only - Sync commands")
-async def sync(interaction: discord.Interaction):
+@app_commands.describe(dev="Sync to the dev guild only", force="Sync even if commands are unchanged")
+async def sync(interaction: discord.Interaction, dev: bool = False, force: bool = False):
     if interaction.user.id != ownerid:
         await interaction.response.send_message("Only the bot owner can use this command!", ephemeral=True)
         return
         
     print("Manual sync requested...")
     try:
-        await bot.tree.sync()
-        await interaction.response.send_message("Commands synced globally!", ephemeral=True)
+        await interaction.response.defer(ephemeral=True)
+        scope = "to the dev guild" if dev else "globally"
+        if await sync_commands(dev=dev, force=force):
+            await interaction.followup.send(f"Commands synced {scope}!", ephemeral=True)
+        else:
+            await interaction.followup.send(f"Commands unchanged {scope}, skipped sync.", ephemeral=True)
     except Exception as e:
         print(f"Failed to sync commands: {e}")
-        await interaction.response.send_message(f"Failed to sync commands: {e}", ephemeral=True)
+        await interaction.followup.send(f"Failed to sync commands: {e}", ephemeral=True)
 
 def get_cog_choices():
     choices = []
@@ -73,27 +109,45 @@ async def reload(interaction: discord.Interaction, cog: app_commands.Choice[str]
                 except Exception as e:
                     print(f"Failed to reload extension {filename}: {e}")
         await interaction.response.send_message("All cogs reloaded!", ephemeral=True)
-        await bot.tree.sync()
+        await sync_commands()
     else:
         try:
             await bot.reload_extension(f"cogs.{cog.value}")
             print(f"Reloaded extension: {cog.value}")
             await interaction.response.send_message(f"Reloaded cog: {cog.value}", ephemeral=True)
-            guild = discord.Object(id=1338581149374480496)
-            bot.tree.copy_global_to(guild=guild)
-            await bot.tree.sync(guild=guild)
+            await sync_commands(dev=True)
         except Exception as e:
             print(f"Failed to reload extension {cog.value}: {e}")
             await interaction.response.send_message(f"Failed to reload cog {cog.value}: {e}", ephemeral=True)
        
+def print_startup_report():
+    print("Startup timings:")
+    for name, timing in sorted(startup_timings.get("extensions", {}).items()):
+        print(f"  {name:<12} import {timing['import'] * 1000:8.1f} ms | setup {timing['setup'] * 1000:8.1f} ms")
+    if "load" in startup_timings:
+        print(f"  {'(all cogs)':<12} {startup_timings['load'] * 1000:8.1f} ms")
+    if "sync" in startup_timings:
+        print(f"  {'(sync)':<12} {startup_timings['sync'] * 1000:8.1f} ms")
+
+async def load_extension_timed(name: str):
+    # Module execution runs before setup() awaits anything, so the time
+    # outside add_cog is the import and the time inside it is cog_load.
+    timing = {}
+    extension_timing.set(timing)
+    start = time.perf_counter()
+    try:
+        await bot.load_extension(f"cogs.{name}")
+        setup = timing.get("setup", 0.0)
+        startup_timings.setdefault("extensions", {})[name] = {"import": time.perf_counter() - start - setup, "setup": setup}
+        print(f"Loaded extension: {name}")
+    except Exception as e:
+        print(f"Failed to load extension {name}: {e}")
+
 async def load_extensions():
-    for filename in os.listdir("./cogs"):
-        if filename.endswith(".py") and filename != "__init__.py":
-            try:
-                await bot.load_extension(f"cogs.{filename[:-3]}")
-                print(f"Loaded extension: {filename[:-3]}")
-            except Exception as e:
-                print(f"Failed to load extension {filename}: {e}")
+    start = time.perf_counter()
+    names = [filename[:-3] for filename in os.listdir("./cogs") if filename.endswith(".py") and filename != "__init__.py"]
+    await asyncio.gather(*(load_extension_timed(name) for name in names))
+    startup_timings["load"] = time.perf_counter() - start
 
 async def main():
     async with bot:
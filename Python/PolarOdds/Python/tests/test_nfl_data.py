@@ -0,0 +1,63 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import nfl_data
+from utils.nfl_data import NFLSeasonData
+
+
+def weekly_frame(rows):
+    return pd.DataFrame(rows, columns=['player_id', 'season', 'week', 'receiving_yards'])
+
+
+def fake_provider(monkeypatch, frames):
+    roster = pd.DataFrame({'player_id': ['a', 'b'], 'player_name': ['A', 'B'], 'position': ['WR', 'WR']})
+    monkeypatch.setattr(nfl_data, 'nfl', SimpleNamespace(
+        import_seasonal_rosters=lambda seasons: roster,
+        import_weekly_data=lambda seasons: frames.pop(0),
+    ))
+
+
+def test_refresh_picks_up_late_rows_for_a_started_week(monkeypatch, tmp_path):
+    fake_provider(monkeypatch, [
+        weekly_frame([('a', 2024, 1, 50), ('b', 2024, 1, 20), ('a', 2024, 2, 30)]),
+        weekly_frame([('a', 2024, 1, 50), ('b', 2024, 1, 20), ('a', 2024, 2, 30), ('b', 2024, 2, 100)]),
+    ])
+    season = NFLSeasonData(2024, data_dir=str(tmp_path))
+    assert season.refresh()
+
+    assert season.refresh()
+    assert season.player_totals('b')['receiving_yards'] == 120
+    assert season.player_totals('a')['receiving_yards'] == 80
+
+
+def test_refresh_applies_stat_corrections_and_reports_no_change(monkeypatch, tmp_path):
+    fake_provider(monkeypatch, [
+        weekly_frame([('a', 2024, 1, 50), ('a', 2024, 2, 30)]),
+        weekly_frame([('a', 2024, 1, 45), ('a', 2024, 2, 30)]),
+        weekly_frame([('a', 2024, 1, 45), ('a', 2024, 2, 30)]),
+    ])
+    season = NFLSeasonData(2024, data_dir=str(tmp_path))
+    season.refresh()
+
+    assert season.refresh()
+    assert season.player_totals('a')['receiving_yards'] == 75
+    assert not season.refresh()
+
+
+def test_saved_totals_match_refreshed_totals(monkeypatch, tmp_path):
+    fake_provider(monkeypatch, [
+        weekly_frame([('a', 2024, 1, 50)]),
+        weekly_frame([('a', 2024, 1, 50), ('b', 2024, 1, 20)]),
+    ])
+    season = NFLSeasonData(2024, data_dir=str(tmp_path))
+    season.refresh()
+    season.refresh()
+
+    reloaded = NFLSeasonData(2024, data_dir=str(tmp_path))
+    reloaded.load()
+    assert reloaded.player_totals('b')['receiving_yards'] == 20
@@ -0,0 +1,73 @@
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.odds import OddsBook
+from utils.parlay import book_legs, evaluate_parlay, load_projections, rank_parlays, remove_vig
+
+
+def nba_book():
+    book = OddsBook("NBA")
+    book.apply([
+        {"id": "lal-gsw", "home_team": "Warriors", "away_team": "Lakers", "markets": {
+            "h2h": [{"name": "Warriors", "price": -135}, {"name": "Lakers", "price": 115}],
+            "totals": [{"name": "Over", "price": -110, "point": 228.5}, {"name": "Under", "price": -110, "point": 228.5}],
+        }},
+        {"id": "bos-nyk", "home_team": "Knicks", "away_team": "Celtics", "markets": {
+            "h2h": [{"name": "Knicks", "price": 120}, {"name": "Celtics", "price": -140}],
+        }},
+    ])
+    return book
+
+
+def test_two_leg_parlay_at_standard_juice():
+    scores = evaluate_parlay([-110, -110], [0.5, 0.5])
+    assert scores.decimal_odds[0] == pytest.approx(3.6446, abs=1e-4)
+    assert round(scores.american_odds[0]) == 264
+    assert scores.probability[0] == pytest.approx(0.25)
+    assert scores.expected_value[0] == pytest.approx(0.25 * 3.6446 - 1, abs=1e-4)
+
+
+def test_remove_vig_normalizes_each_market():
+    fair = remove_vig([[-110, -110], [-135, 115]])
+    assert fair.sum(axis=1) == pytest.approx([1, 1])
+    assert fair[0] == pytest.approx([0.5, 0.5])
+
+
+def test_rank_parlays_orders_by_ev_and_skips_same_group():
+    prices = np.array([100, 100, 100, 100], dtype=float)
+    probabilities = np.array([0.6, 0.55, 0.5, 0.45])
+    scores = rank_parlays(prices, probabilities, 2, top=3, groups=["a", "a", "b", "c"])
+
+    assert [sorted(combo) for combo in scores.combos.tolist()] == [[0, 2], [1, 2], [0, 3]]
+    assert list(scores.expected_value) == sorted(scores.expected_value, reverse=True)
+    assert scores.expected_value[0] == pytest.approx(0.6 * 0.5 * 4 - 1)
+
+
+def test_book_legs_only_scores_projected_legs():
+    projections = {("lal-gsw", "h2h", "Lakers"): 0.52, ("bos-nyk", "h2h", "Knicks"): 0.5, ("lal-gsw", "totals", "Over"): 0.55}
+    labels, prices, probabilities, groups = book_legs(nba_book(), projections)
+
+    assert labels == ["Lakers @ Warriors: Lakers", "Lakers @ Warriors: Over 228.5", "Celtics @ Knicks: Knicks"]
+    assert list(prices) == [115, -110, 120]
+    assert list(probabilities) == [0.52, 0.55, 0.5]
+
+    scores = rank_parlays(prices, probabilities, 2, top=5, groups=groups)
+    assert len(scores.combos) == 2
+    assert (scores.expected_value > 0).all()
+
+
+def test_load_projections(tmp_path):
+    path = tmp_path / "projections.json"
+    path.write_text(json.dumps({"NBA": [{"event_id": "lal-gsw", "market": "h2h", "selection": "Lakers", "probability": 0.52}]}))
+    assert load_projections("NBA", str(path)) == {("lal-gsw", "h2h", "Lakers"): 0.52}
+    assert load_projections("MLB", str(path)) == {}
+
+    path.write_text(json.dumps({"NBA": [{"event_id": "lal-gsw", "market": "h2h", "selection": "Lakers", "probability": 52}]}))
+    with pytest.raises(ValueError):
+        load_projections("NBA", str(path))
@@ -0,0 +1,46 @@
+import difflib
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.search import PlayerIndex
+
+
+def mlb_index(extra=()):
+    index = PlayerIndex()
+    index.add(1, "Mookie Betts", ["Betts", "Mookie Betts", "Markus Lynn Betts"])
+    index.add(2, "Christian Moore", ["Moore", "Christian Moore"])
+    index.add(3, "Juan Soto", ["Soto, J", "Juan Soto", "Juan Jose Soto"])
+    index.add(4, "Gregory Soto", ["Soto", "Gregory Soto"])
+    for player_id, name in extra:
+        index.add(player_id, name, [name.split()[-1]])
+    return index
+
+
+def test_full_name_match_outranks_last_name_alias():
+    index = mlb_index()
+    assert index.search("mookie")[0].name == "Mookie Betts"
+    assert index.search("soto")[0].name == "Juan Soto"
+
+
+def test_alias_matches_do_not_pad_a_full_name_hit():
+    index = mlb_index([(20, "Shohei Ohtani"), (21, "Michel Otanez"), (22, "Ryan O'Hearn"), (23, "James Outman")])
+    assert [m.name for m in index.search("ohtanii", n=5)] == ["Shohei Ohtani"]
+
+
+def test_alias_is_used_when_no_full_name_matches():
+    index = PlayerIndex()
+    index.add(1, "Marquise Brown", ["Hollywood Brown"])
+    index.add(2, "Noah Brown")
+    assert [m.name for m in index.search("hollywood brown")] == ["Marquise Brown"]
+
+
+def test_results_match_difflib_when_shortlist_is_too_narrow():
+    names = ["Jacob deGrom", "Jacob Degroot", "Jake deGrom", "Jacob Webb"]
+    index = mlb_index(enumerate(names, start=10))
+    index.shortlist = 1
+
+    expected = difflib.get_close_matches("jacb degrom", [n.lower() for n in names], n=3, cutoff=0.6)
+    assert len(expected) == 3
+    assert [m.name.lower() for m in index.search("jacb degrom")] == expected
@@ -0,0 +1,93 @@
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.singleflight import SingleFlight
+
+
+class Fetch:
+    def __init__(self):
+        self.calls = 0
+        self.cancelled = False
+        self.release = None
+
+    async def __call__(self):
+        self.calls += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return "stats"
+
+
+def run(scenario):
+    async def main():
+        fetch = Fetch()
+        fetch.release = asyncio.Event()
+        return fetch, await scenario(SingleFlight(), fetch)
+    return asyncio.run(main())
+
+
+def test_concurrent_callers_share_one_call():
+    async def scenario(flight, fetch):
+        callers = [asyncio.create_task(flight.do("key", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        fetch.release.set()
+        return await asyncio.gather(*callers)
+
+    fetch, results = run(scenario)
+    assert fetch.calls == 1
+    assert results == ["stats"] * 3
+
+
+def test_abandoned_speculative_call_is_cancelled():
+    async def scenario(flight, fetch):
+        prefetch = asyncio.create_task(flight.do_speculative("key", fetch))
+        await asyncio.sleep(0)
+        prefetch.cancel()
+        await asyncio.gather(prefetch, return_exceptions=True)
+        await asyncio.sleep(0)
+        return "key" in flight
+
+    fetch, in_flight = run(scenario)
+    assert fetch.cancelled
+    assert not in_flight
+
+
+def test_speculative_call_joined_by_a_caller_keeps_running():
+    async def scenario(flight, fetch):
+        prefetch = asyncio.create_task(flight.do_speculative("key", fetch))
+        await asyncio.sleep(0)
+        click = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        prefetch.cancel()
+        await asyncio.sleep(0)
+        fetch.release.set()
+        return await click
+
+    fetch, result = run(scenario)
+    assert not fetch.cancelled
+    assert result == "stats"
+
+
+def test_speculative_caller_does_not_cancel_a_regular_call():
+    async def scenario(flight, fetch):
+        regular = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        prefetch = asyncio.create_task(flight.do_speculative("key", fetch))
+        await asyncio.sleep(0)
+        regular.cancel()
+        prefetch.cancel()
+        await asyncio.gather(regular, prefetch, return_exceptions=True)
+        await asyncio.sleep(0)
+        fetch.release.set()
+        await asyncio.sleep(0.01)
+        return "key" in flight
+
+    fetch, in_flight = run(scenario)
+    assert not fetch.cancelled
+    assert fetch.calls == 1
+    assert not in_flight
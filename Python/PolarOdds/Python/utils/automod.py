@@ -0,0 +1,63 @@
+import json
+import os
+import re
+
+
+AUTOMOD_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'automod.json')
+
+DEFAULT_RULES = {
+    "substrings": ["discord.gg", "https://"],
+    "patterns": [],
+    "exempt_role_ids": [],
+    "timeout_role_id": None,
+    "notice_channel_id": None,
+    "timeout_seconds": 0
+}
+
+
+class GuildRules:
+    __slots__ = ('matcher', 'exempt_role_ids', 'timeout_role_id', 'notice_channel_id', 'timeout_seconds')
+
+    def __init__(self, config: dict):
+        alternatives = [re.escape(s) for s in config.get("substrings", [])]
+        alternatives += [f"(?:{p})" for p in config.get("patterns", [])]
+        self.matcher = re.compile("|".join(alternatives), re.IGNORECASE) if alternatives else None
+        self.exempt_role_ids = frozenset(int(role_id) for role_id in config.get("exempt_role_ids", []))
+        self.timeout_role_id = config.get("timeout_role_id")
+        self.notice_channel_id = config.get("notice_channel_id")
+        self.timeout_seconds = config.get("timeout_seconds", 0)
+
+    def search(self, content: str):
+        if self.matcher is None or not content:
+            return None
+        return self.matcher.search(content)
+
+    def is_exempt(self, member) -> bool:
+        if not self.exempt_role_ids:
+            return False
+        return any(role.id in self.exempt_role_ids for role in getattr(member, "roles", ()))
+
+
+class RuleEngine:
+    def __init__(self, path: str = AUTOMOD_CONFIG_PATH):
+        self.path = path
+        self.default = GuildRules(DEFAULT_RULES)
+        self.guilds = {}
+
+    def load(self):
+        config = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                config = json.load(f)
+
+        base = {**DEFAULT_RULES, **config.get("default", {})}
+        default = GuildRules(base)
+        guilds = {
+            int(guild_id): GuildRules({**base, **overrides})
+            for guild_id, overrides in config.get("guilds", {}).items()
+        }
+        self.default, self.guilds = default, guilds
+        return len(guilds)
+
+    def for_guild(self, guild_id: int) -> GuildRules:
+        return self.guilds.get(guild_id, self.default)
@@ -0,0 +1,94 @@
+import time
+from collections import Counter, OrderedDict
+
+from utils.metrics import metrics
+
+
+class CacheEntry:
+    __slots__ = ('value', 'fresh_until', 'stale_until')
+
+    def __init__(self, value, fresh_until: float, stale_until: float):
+        self.value = value
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class StatsCache:
+    def __init__(self, maxsize: int, ttl: float, stale_ttl: float, timer=time.monotonic, name: str = None):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.timer = timer
+        self.frequency = Counter()
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return self.lookup(key, count=False)[0] is not None
+
+    def __getitem__(self, key):
+        value, _ = self.lookup(key, count=False)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.set(key, value)
+
+    def lookup(self, key, count: bool = True):
+        if count:
+            self.frequency[key] += 1
+        entry = self._entries.get(key)
+        if entry is None:
+            self._record(count, "miss")
+            return None, False
+        now = self.timer()
+        if now >= entry.stale_until:
+            del self._entries[key]
+            self._record(count, "expired")
+            return None, False
+        self._entries.move_to_end(key)
+        fresh = now < entry.fresh_until
+        self._record(count, "hit" if fresh else "stale")
+        return entry.value, fresh
+
+    def _record(self, count: bool, result: str):
+        if count and self.name:
+            metrics.inc("cache_lookups_total", cache=self.name, result=result)
+
+    def set(self, key, value, ttl: float = None):
+        ttl = self.ttl if ttl is None else ttl
+        now = self.timer()
+        self._entries[key] = CacheEntry(value, now + ttl, now + ttl + self.stale_ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            if self.name:
+                metrics.inc("cache_evictions_total", cache=self.name)
+
+    def pop(self, key, default=None):
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry.value
+
+    def clear(self):
+        self._entries.clear()
+
+    def expires_in(self, key) -> float:
+        entry = self._entries.get(key)
+        if entry is None:
+            return 0.0
+        return entry.fresh_until - self.timer()
+
+    def hottest(self, n: int) -> list:
+        return [key for key, _ in self.frequency.most_common(n)]
+
+    def decay(self, factor: float = 0.5):
+        for key, count in list(self.frequency.items()):
+            count = int(count * factor)
+            if count:
+                self.frequency[key] = count
+            else:
+                del self.frequency[key]
@@ -0,0 +1,166 @@
+import asyncio
+import heapq
+import itertools
+import time
+from collections import Counter
+
+import discord
+
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_CONTENT_LENGTH = 2000
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    async def acquire(self):
+        wait = self.reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+
+class Notification:
+    __slots__ = ('target', 'content', 'embeds', 'priority', 'queued_at')
+
+    def __init__(self, target, content: str = None, embeds: list = None, priority: int = PRIORITY_NORMAL):
+        self.target = target
+        self.content = content
+        self.embeds = embeds or []
+        self.priority = priority
+        self.queued_at = time.monotonic()
+
+
+def route_for(target) -> str:
+    if isinstance(target, (discord.User, discord.Member)):
+        return f"dm:{target.id}"
+    return f"channel:{target.id}"
+
+
+class Dispatcher:
+    def __init__(self, global_rate: float = 25, route_rate: float = 1, route_burst: float = 5, max_routes: int = 5000):
+        self.global_bucket = TokenBucket(global_rate, global_rate)
+        self.max_routes = max_routes
+        self.route_rate = route_rate
+        self.route_burst = route_burst
+        self.metrics = Counter()
+        self.max_latency = 0.0
+        self._seq = itertools.count()
+        self._routes = {}
+        self._lanes = {}
+        self._drainers = {}
+        self._tickets = asyncio.PriorityQueue()
+        self._pacer = None
+
+    def start(self):
+        if self._pacer is None:
+            self._pacer = asyncio.create_task(self._pace())
+
+    async def close(self):
+        tasks = [task for task in (self._pacer, *self._drainers.values()) if task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._pacer = None
+        self._drainers.clear()
+
+    def pending(self) -> int:
+        return sum(len(lane) for lane in self._lanes.values())
+
+    def submit(self, notification: Notification):
+        route = route_for(notification.target)
+        lane = self._lanes.setdefault(route, [])
+        heapq.heappush(lane, (notification.priority, next(self._seq), notification))
+        self.metrics['queued'] += 1
+        if route not in self._drainers:
+            self._drainers[route] = asyncio.create_task(self._drain(route))
+
+    async def _pace(self):
+        # Hands out global send slots in priority order, so a backlog of
+        # low priority pings never delays a high priority one.
+        while True:
+            _, _, ticket = await self._tickets.get()
+            if ticket.cancelled():
+                continue
+            await self.global_bucket.acquire()
+            if not ticket.done():
+                ticket.set_result(None)
+
+    async def _global_slot(self, priority: int):
+        ticket = asyncio.get_running_loop().create_future()
+        self._tickets.put_nowait((priority, next(self._seq), ticket))
+        await ticket
+
+    async def _drain(self, route: str):
+        lane = self._lanes[route]
+        bucket = self._routes.get(route)
+        if bucket is None:
+            if len(self._routes) >= self.max_routes:
+                for idle in [r for r in self._routes if r not in self._drainers]:
+                    del self._routes[idle]
+            bucket = self._routes[route] = TokenBucket(self.route_rate, self.route_burst)
+        try:
+            while lane:
+                batch = [heapq.heappop(lane)[2]]
+                embeds = len(batch[0].embeds)
+                lines = {batch[0].content} if batch[0].content else set()
+                length = len(batch[0].content or "")
+                while lane:
+                    candidate = lane[0][2]
+                    # Repeated content such as a role mention is only sent once.
+                    extra = 0
+                    if candidate.content and candidate.content not in lines:
+                        extra = len(candidate.content) + (1 if lines else 0)
+                    if embeds + len(candidate.embeds) > MAX_EMBEDS_PER_MESSAGE or length + extra > MAX_CONTENT_LENGTH:
+                        break
+                    batch.append(heapq.heappop(lane)[2])
+                    embeds += len(candidate.embeds)
+                    length += extra
+                    if candidate.content:
+                        lines.add(candidate.content)
+
+                await bucket.acquire()
+                await self._global_slot(batch[0].priority)
+                await self._deliver(batch)
+        finally:
+            self._drainers.pop(route, None)
+            if not lane:
+                self._lanes.pop(route, None)
+
+    async def _deliver(self, batch: list):
+        target = batch[0].target
+        content = "\n".join(dict.fromkeys(n.content for n in batch if n.content)) or None
+        embeds = [em for n in batch for em in n.embeds]
+        try:
+            await target.send(content=content, embeds=embeds)
+        except discord.Forbidden:
+            self.metrics['forbidden'] += len(batch)
+            return
+        except discord.HTTPException as e:
+            self.metrics['rate_limited' if e.status == 429 else 'failed'] += len(batch)
+            return
+        except Exception as e:
+            print(f"Error delivering notification to {target}: {e}")
+            self.metrics['failed'] += len(batch)
+            return
+
+        now = time.monotonic()
+        self.metrics['messages'] += 1
+        self.metrics['delivered'] += len(batch)
+        self.metrics['batched'] += len(batch) - 1
+        self.max_latency = max(self.max_latency, max(now - n.queued_at for n in batch))
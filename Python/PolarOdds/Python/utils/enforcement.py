@@ -0,0 +1,70 @@
+import asyncio
+import time
+
+import discord
+
+
+BULK_DELETE_LIMIT = 100
+
+
+class EnforcementQueue:
+    def __init__(self, dedupe_window: float = 60, batch_delay: float = 0.5, concurrency: int = 10):
+        self.dedupe_window = dedupe_window
+        self.batch_delay = batch_delay
+        self._slots = asyncio.Semaphore(concurrency)
+        self._offenders = {}
+        self._deletes = {}
+        self._tasks = set()
+
+    def _spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def delete(self, message: discord.Message):
+        pending = self._deletes.get(message.channel.id)
+        if pending is None:
+            self._deletes[message.channel.id] = [message]
+            self._spawn(self._flush_deletes(message.channel))
+        else:
+            pending.append(message)
+
+    async def _flush_deletes(self, channel):
+        await asyncio.sleep(self.batch_delay)
+        messages = self._deletes.pop(channel.id, [])
+        for start in range(0, len(messages), BULK_DELETE_LIMIT):
+            batch = messages[start:start + BULK_DELETE_LIMIT]
+            try:
+                if len(batch) == 1:
+                    await batch[0].delete()
+                else:
+                    await channel.delete_messages(batch, reason="PolarOdds: AutoMod (Link Blocking).")
+            except discord.NotFound:
+                pass
+            except discord.HTTPException as e:
+                print(f"AutoMod failed to delete {len(batch)} messages in {channel}: {e}")
+
+    def punish(self, key, func, *args) -> bool:
+        now = time.monotonic()
+        last = self._offenders.get(key)
+        if last is not None and now - last < self.dedupe_window:
+            return False
+
+        self._offenders[key] = now
+        if len(self._offenders) > 1000:
+            self._offenders = {k: t for k, t in self._offenders.items() if now - t < self.dedupe_window}
+        self._spawn(self._run(func, *args))
+        return True
+
+    async def _run(self, func, *args):
+        async with self._slots:
+            try:
+                await func(*args)
+            except Exception as e:
+                print(f"AutoMod enforcement failed: {e}")
+
+    async def close(self):
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
@@ -0,0 +1,68 @@
+import asyncio
+import functools
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from utils.metrics import metrics
+
+
+class ProviderTimeout(Exception):
+    pass
+
+
+class ProviderPool:
+    def __init__(self, name: str, max_workers: int = 4, timeout: float = 15.0, backlog: int = None, processes: bool = False):
+        self.name = name
+        self.timeout = timeout
+        if processes:
+            self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"provider-{name}")
+        # Bounds work handed to the pool (running + queued). A slot is only
+        # released once the worker actually finishes, so timed out calls that
+        # are still running keep counting against the provider.
+        self._slots = asyncio.Semaphore(backlog or max_workers * 2)
+
+    async def run(self, func, *args, timeout: float = None, **kwargs):
+        loop = asyncio.get_running_loop()
+        timeout = timeout or self.timeout
+
+        await self._slots.acquire()
+        try:
+            cfuture = self._executor.submit(functools.partial(func, *args, **kwargs))
+        except BaseException:
+            self._slots.release()
+            raise
+        def release(_):
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._slots.release)
+        cfuture.add_done_callback(release)
+
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(cfuture), timeout)
+        except asyncio.TimeoutError:
+            status = "timeout"
+            raise ProviderTimeout(f"{self.name} provider call timed out after {timeout}s") from None
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            metrics.observe("provider_call_seconds", time.perf_counter() - start, provider=self.name)
+            metrics.inc("provider_calls_total", provider=self.name, status=status)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ProviderExecutor:
+    def __init__(self, pools: dict):
+        self.pools = {name: ProviderPool(name, **config) for name, config in pools.items()}
+
+    async def run(self, provider: str, func, *args, **kwargs):
+        return await self.pools[provider].run(func, *args, **kwargs)
+
+    def shutdown(self):
+        for pool in self.pools.values():
+            pool.shutdown()
@@ -0,0 +1,31 @@
+import importlib
+import threading
+
+
+class LazyModule:
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def defer(self, attr: str):
+        # Resolves the attribute when called, so handing the callable to a
+        # provider pool keeps the import itself on the worker thread.
+        def call(*args, **kwargs):
+            return getattr(self._load(), attr)(*args, **kwargs)
+        call.__name__ = attr
+        return call
+
+
+def lazy_import(name: str) -> LazyModule:
+    return LazyModule(name)
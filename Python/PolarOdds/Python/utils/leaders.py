@@ -0,0 +1,243 @@
+import os
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+
+LEADERS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'leaders')
+
+POSITION_GROUPS = {
+    "OF": ("LF", "CF", "RF", "OF"),
+    "IF": ("1B", "2B", "3B", "SS"),
+    "DB": ("CB", "S", "SS", "FS"),
+    "DL": ("DT", "DE", "NT"),
+    "OL": ("T", "G", "C", "OT", "OG"),
+}
+
+
+class LeaderStat(NamedTuple):
+    table: str
+    column: str
+    label: str
+    ascending: bool = False
+    qualifier: tuple = None
+    decimals: int = None
+
+
+LEADER_STATS = {
+    "NBA": {
+        "pts": LeaderStat("NBA", "PTS", "Points per game", decimals=1),
+        "reb": LeaderStat("NBA", "REB", "Rebounds per game", decimals=1),
+        "ast": LeaderStat("NBA", "AST", "Assists per game", decimals=1),
+        "stl": LeaderStat("NBA", "STL", "Steals per game", decimals=1),
+        "blk": LeaderStat("NBA", "BLK", "Blocks per game", decimals=1),
+        "3pm": LeaderStat("NBA", "FG3M", "Threes made per game", decimals=1),
+        "fg%": LeaderStat("NBA", "FG_PCT", "Field goal %", qualifier=("FGA", 5), decimals=3),
+        "min": LeaderStat("NBA", "MIN", "Minutes per game", decimals=1),
+    },
+    "NFL": {
+        "pass_yds": LeaderStat("NFL", "passing_yards", "Passing yards"),
+        "pass_td": LeaderStat("NFL", "passing_tds", "Passing touchdowns"),
+        "int": LeaderStat("NFL", "interceptions", "Interceptions thrown"),
+        "rush_yds": LeaderStat("NFL", "rushing_yards", "Rushing yards"),
+        "rush_td": LeaderStat("NFL", "rushing_tds", "Rushing touchdowns"),
+        "rec": LeaderStat("NFL", "receptions", "Receptions"),
+        "rec_yds": LeaderStat("NFL", "receiving_yards", "Receiving yards"),
+        "rec_td": LeaderStat("NFL", "receiving_tds", "Receiving touchdowns"),
+        "targets": LeaderStat("NFL", "targets", "Targets"),
+        "fantasy": LeaderStat("NFL", "fantasy_points_ppr", "PPR fantasy points", decimals=1),
+    },
+    "MLB": {
+        "hr": LeaderStat("MLB-hitting", "homeRuns", "Home runs"),
+        "rbi": LeaderStat("MLB-hitting", "rbi", "RBI"),
+        "hits": LeaderStat("MLB-hitting", "hits", "Hits"),
+        "runs": LeaderStat("MLB-hitting", "runs", "Runs"),
+        "sb": LeaderStat("MLB-hitting", "stolenBases", "Stolen bases"),
+        "avg": LeaderStat("MLB-hitting", "avg", "Batting average", qualifier=("plateAppearances", 100), decimals=3),
+        "obp": LeaderStat("MLB-hitting", "obp", "On-base %", qualifier=("plateAppearances", 100), decimals=3),
+        "ops": LeaderStat("MLB-hitting", "ops", "OPS", qualifier=("plateAppearances", 100), decimals=3),
+        "k": LeaderStat("MLB-pitching", "strikeOuts", "Strikeouts (pitching)"),
+        "wins": LeaderStat("MLB-pitching", "wins", "Wins"),
+        "saves": LeaderStat("MLB-pitching", "saves", "Saves"),
+        "era": LeaderStat("MLB-pitching", "era", "ERA", ascending=True, qualifier=("inningsPitched", 40), decimals=2),
+        "whip": LeaderStat("MLB-pitching", "whip", "WHIP", ascending=True, qualifier=("inningsPitched", 40), decimals=2),
+    },
+}
+
+
+class Leader(NamedTuple):
+    player_id: str
+    name: str
+    position: str
+    value: float
+
+
+def position_tokens(position: str) -> set:
+    return {token for token in str(position or "").upper().replace("/", "-").split("-") if token}
+
+
+def expand_positions(positions) -> set:
+    expanded = set()
+    for position in positions:
+        position = position.strip().upper()
+        expanded.update(POSITION_GROUPS.get(position, (position,)))
+    return expanded
+
+
+class SeasonTable:
+    def __init__(self, ids, names, positions, columns: dict, built_at: float = None):
+        self.ids = np.asarray(ids, dtype=str)
+        self.names = np.asarray(names, dtype=str)
+        self.positions = np.asarray(positions, dtype=str)
+        self.columns = {name: np.asarray(values, dtype=np.float64) for name, values in columns.items()}
+        self.built_at = built_at or time.time()
+        self._position_masks = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    def position_mask(self, positions) -> np.ndarray:
+        if self._position_masks is None:
+            # Only a handful of distinct position strings exist, so build one
+            # mask per token from the unique values instead of per row.
+            unique, inverse = np.unique(self.positions, return_inverse=True)
+            owners = {}
+            for code, position in enumerate(unique):
+                for token in position_tokens(position):
+                    owners.setdefault(token, []).append(code)
+            self._position_masks = {token: np.isin(inverse, codes) for token, codes in owners.items()}
+        mask = np.zeros(len(self), dtype=bool)
+        for token in expand_positions(positions):
+            if token in self._position_masks:
+                mask |= self._position_masks[token]
+        return mask
+
+    def top(self, column: str, n: int = 10, positions=None, ascending: bool = False, qualifier: tuple = None) -> list:
+        values = self.columns.get(column)
+        if values is None or not len(values):
+            return []
+
+        mask = ~np.isnan(values)
+        if not ascending:
+            mask &= values != 0
+        if positions:
+            mask &= self.position_mask(positions)
+        if qualifier and qualifier[0] in self.columns:
+            mask &= self.columns[qualifier[0]] >= qualifier[1]
+
+        rows = np.flatnonzero(mask)
+        if not len(rows):
+            return []
+        keys = values[rows] if ascending else -values[rows]
+        k = min(n, len(rows))
+        if k < len(rows):
+            picked = np.argpartition(keys, k - 1)[:k]
+        else:
+            picked = np.arange(len(rows))
+        picked = picked[np.argsort(keys[picked], kind="stable")]
+        return [
+            Leader(self.ids[row], self.names[row], self.positions[row], float(values[row]))
+            for row in rows[picked]
+        ]
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp.npz"
+        np.savez_compressed(
+            tmp_path,
+            ids=self.ids,
+            names=self.names,
+            positions=self.positions,
+            built_at=np.float64(self.built_at),
+            **{f"col:{name}": values for name, values in self.columns.items()}
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str):
+        with np.load(path) as data:
+            columns = {key[4:]: data[key] for key in data.files if key.startswith("col:")}
+            return cls(data["ids"], data["names"], data["positions"], columns, float(data["built_at"]))
+
+
+def table_path(name: str, data_dir: str = LEADERS_DIR) -> str:
+    return os.path.join(data_dir, f"{name}.npz")
+
+
+def load_table(name: str, data_dir: str = LEADERS_DIR):
+    path = table_path(name, data_dir)
+    if not os.path.exists(path):
+        return None
+    try:
+        return SeasonTable.load(path)
+    except Exception as e:
+        print(f"Error reading {name} leader table: {e}")
+        return None
+
+
+def numeric_columns(records: list) -> dict:
+    keys = {key for record in records for key, value in record.items() if to_number(key, value) is not None}
+    return {key: [to_number(key, record.get(key)) for record in records] for key in keys}
+
+
+def to_number(key: str, value):
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    if key == "inningsPitched":
+        # "133.1" is 133 and one third innings.
+        whole, outs = divmod(round(number * 10), 10)
+        return whole + outs / 3
+    return number
+
+
+def build_nba_table(frame, positions: dict) -> SeasonTable:
+    columns = {column: frame[column].to_numpy(dtype=np.float64) for column in frame.select_dtypes("number").columns}
+    return SeasonTable(
+        frame["PLAYER_ID"].to_numpy(),
+        frame["PLAYER_NAME"].to_numpy(),
+        [positions.get(player_id, "") for player_id in frame["PLAYER_ID"]],
+        columns,
+    )
+
+
+def build_nfl_table(roster, totals) -> SeasonTable:
+    roster = roster.drop_duplicates("player_id").set_index("player_id")
+    totals = totals[totals.index.isin(roster.index)]
+    players = roster.loc[totals.index]
+    columns = {column: totals[column].to_numpy(dtype=np.float64) for column in totals.columns}
+    return SeasonTable(totals.index.to_numpy(), players["player_name"].to_numpy(), players["position"].fillna("").to_numpy(), columns)
+
+
+def build_mlb_tables(players: list, raw_stats: dict) -> dict:
+    rows = {"hitting": [], "pitching": []}
+    for player in players:
+        raw = raw_stats.get(player["id"])
+        if not raw:
+            continue
+        for entry in raw.get("stats", []):
+            if entry.get("group") in rows and entry.get("stats"):
+                rows[entry["group"]].append((player, entry["stats"]))
+
+    tables = {}
+    for group, entries in rows.items():
+        tables[f"MLB-{group}"] = SeasonTable(
+            [player["id"] for player, _ in entries],
+            [player["fullName"] for player, _ in entries],
+            [player.get("primaryPosition", {}).get("abbreviation", "") for player, _ in entries],
+            numeric_columns([stats for _, stats in entries]),
+        )
+    return tables
+
+
+def format_leader_value(value: float, decimals: int = None) -> str:
+    if decimals is None:
+        return f"{value:.0f}" if float(value).is_integer() else f"{value:.1f}"
+    text = f"{value:.{decimals}f}"
+    return text[1:] if text.startswith("0.") and decimals == 3 else text
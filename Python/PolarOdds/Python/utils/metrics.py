@@ -0,0 +1,143 @@
+import bisect
+import os
+import time
+from contextlib import contextmanager
+
+import discord
+from discord import app_commands
+
+
+METRICS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'metrics.prom')
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    __slots__ = ('buckets', 'counts', 'count', 'sum', 'max')
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = self.buckets[i - 1] if i else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.max
+                return min(lower + (upper - lower) * (rank - seen) / bucket_count, self.max)
+            seen += bucket_count
+        return self.max
+
+
+def format_labels(labels: tuple, extra: str = None) -> str:
+    parts = [f'{key}="{value}"' for key, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Metrics:
+    def __init__(self):
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+
+    def inc(self, name: str, amount: float = 1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        self.counters[key] = self.counters.get(key, 0) + amount
+
+    def set(self, name: str, value: float, **labels):
+        self.gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def observe(self, name: str, value: float, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram()
+        histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def counter_value(self, name: str, **labels) -> float:
+        return self.counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def render(self) -> str:
+        lines = []
+        typed = set()
+
+        def declare(name, kind):
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} {kind}")
+
+        for (name, labels), value in sorted(self.counters.items()):
+            declare(name, "counter")
+            lines.append(f"{name}{format_labels(labels)} {value}")
+        for (name, labels), value in sorted(self.gauges.items()):
+            declare(name, "gauge")
+            lines.append(f"{name}{format_labels(labels)} {value}")
+        for (name, labels), histogram in sorted(self.histograms.items()):
+            declare(name, "histogram")
+            cumulative = 0
+            for bound, bucket_count in zip(histogram.buckets, histogram.counts):
+                cumulative += bucket_count
+                bucket_labels = format_labels(labels, f'le="{bound}"')
+                lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+            bucket_labels = format_labels(labels, 'le="+Inf"')
+            lines.append(f"{name}_bucket{bucket_labels} {histogram.count}")
+            lines.append(f"{name}_sum{format_labels(labels)} {histogram.sum}")
+            lines.append(f"{name}_count{format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
+
+
+def write_metrics_file(text: str, path: str = METRICS_PATH):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def command_name(interaction: discord.Interaction) -> str:
+    command = interaction.command
+    return command.qualified_name if command else "unknown"
+
+
+def record_command(interaction: discord.Interaction, status: str):
+    started_at = interaction.extras.get("started_at")
+    if started_at is None:
+        return
+    name = command_name(interaction)
+    metrics.observe("command_latency_seconds", time.perf_counter() - started_at, command=name)
+    metrics.inc("commands_total", command=name, status=status)
+
+
+class InstrumentedTree(app_commands.CommandTree):
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        interaction.extras["started_at"] = time.perf_counter()
+        return True
+
+    async def on_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        record_command(interaction, "error")
+        await super().on_error(interaction, error)
@@ -0,0 +1,140 @@
+import asyncio
+import random
+import time
+from datetime import datetime
+
+import aiohttp
+
+from utils.metrics import metrics
+
+
+BASE_URL = "https://statsapi.mlb.com/api/v1"
+
+PLAYER_FIELDS = (
+    "people,id,fullName,firstName,lastName,primaryNumber,currentTeam,id,primaryPosition,code,abbreviation,"
+    "useName,boxscoreName,nickName,mlbDebutDate,nameFirstLast,firstLastName,lastFirstName,lastInitName,"
+    "initLastName,fullFMLName,fullLFMName,nameSlug"
+)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class MLBApiError(Exception):
+    pass
+
+
+def parse_person(person: dict) -> dict:
+    # Same shape statsapi.player_stat_data returns, so callers and recorded
+    # fixtures did not have to change.
+    stats = []
+    for entry in person.get("stats", []):
+        for split in entry.get("splits", []):
+            stats.append({
+                "type": entry["type"]["displayName"],
+                "group": entry["group"]["displayName"],
+                "season": split.get("season"),
+                "stats": split["stat"],
+            })
+
+    return {
+        "id": person["id"],
+        "first_name": person.get("useName"),
+        "last_name": person.get("lastName"),
+        "active": person.get("active"),
+        "current_team": person.get("currentTeam", {}).get("name"),
+        "position": person.get("primaryPosition", {}).get("abbreviation"),
+        "nickname": person.get("nickName"),
+        "last_played": person.get("lastPlayedDate"),
+        "mlb_debut": person.get("mlbDebutDate"),
+        "bat_side": person.get("batSide", {}).get("description"),
+        "pitch_hand": person.get("pitchHand", {}).get("description"),
+        "stats": stats,
+    }
+
+
+def stats_hydrate(group: str, stat_type: str = "season", season: int = None, sport_id: int = 1) -> str:
+    season_part = f",season={season}" if season else ""
+    return f"stats(group={group},type={stat_type}{season_part},sportId={sport_id}),currentTeam"
+
+
+class MLBStatsClient:
+    def __init__(self, base_url: str = BASE_URL, limit: int = 8, timeout: float = 10.0,
+                 retries: int = 3, backoff: float = 0.5, batch_size: int = 50):
+        self.base_url = base_url
+        self.limit = limit
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.batch_size = batch_size
+        self._session = None
+
+    def session(self) -> aiohttp.ClientSession:
+        # One keep-alive pool shared by every request; at most `limit`
+        # connections are open to the API at a time.
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit, keepalive_timeout=60, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"Accept-Encoding": "gzip"},
+            )
+        return self._session
+
+    async def get(self, path: str, params: dict = None) -> dict:
+        url = f"{self.base_url}/{path}"
+        for attempt in range(self.retries + 1):
+            start = time.perf_counter()
+            status = "error"
+            try:
+                async with self.session().get(url, params=params) as response:
+                    status = str(response.status)
+                    if response.status == 200:
+                        return await response.json()
+                    if response.status not in RETRY_STATUSES:
+                        raise MLBApiError(f"MLB API {path} returned {response.status}")
+                    error = MLBApiError(f"MLB API {path} returned {response.status}")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = e
+            finally:
+                metrics.observe("mlb_api_request_seconds", time.perf_counter() - start, endpoint=path.split("/")[0])
+                metrics.inc("mlb_api_requests_total", endpoint=path.split("/")[0], status=status)
+
+            if attempt == self.retries:
+                raise MLBApiError(f"MLB API {path} failed after {attempt + 1} attempts: {error}") from error
+            await asyncio.sleep(self.backoff * 2 ** attempt * (0.5 + random.random()))
+
+    async def latest_season(self, sport_id: int = 1) -> int:
+        data = await self.get("seasons", {"sportId": sport_id})
+        seasons = data.get("seasons") or [{}]
+        return int(seasons[-1].get("seasonId", datetime.now().year))
+
+    async def lookup_players(self, season: int = None, sport_id: int = 1) -> list:
+        if season is None:
+            season = await self.latest_season(sport_id)
+        data = await self.get(f"sports/{sport_id}/players", {"season": season, "fields": PLAYER_FIELDS})
+        return data.get("people", [])
+
+    async def player_stats(self, person_id: int, group: str = "hitting", season: int = None) -> dict:
+        data = await self.get(f"people/{person_id}", {"hydrate": stats_hydrate(group, season=season)})
+        people = data.get("people") or []
+        if not people:
+            return None
+        return parse_person(people[0])
+
+    async def season_stats(self, person_ids: list, group: str = "[hitting,pitching]", season: int = None) -> dict:
+        # Hydrates many players per request via personIds; batches run
+        # concurrently over the shared connection pool.
+        hydrate = stats_hydrate(group, season=season)
+        batches = [person_ids[i:i + self.batch_size] for i in range(0, len(person_ids), self.batch_size)]
+        responses = await asyncio.gather(*(
+            self.get("people", {"personIds": ",".join(str(pid) for pid in batch), "hydrate": hydrate})
+            for batch in batches
+        ))
+        return {
+            person["id"]: parse_person(person)
+            for data in responses
+            for person in data.get("people", [])
+        }
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
@@ -0,0 +1,76 @@
+import json
+import os
+from datetime import datetime
+
+from utils.search import PlayerIndex, normalize_name
+
+
+DUMP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'mlb_players_dump.json')
+
+ALIAS_KEYS = ('boxscoreName', 'nameFirstLast', 'fullFMLName')
+
+
+def read_player_dump(path: str = DUMP_PATH) -> list:
+    if not os.path.exists(path):
+        print(f"MLB player dump not found: {path}")
+        return []
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Error loading MLB player dump: {e}")
+        return []
+
+
+def write_player_dump(players: list, path: str = DUMP_PATH):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(players, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+class MLBDirectory:
+    def __init__(self, players: list):
+        self.players = players
+        self.by_id = {}
+        self.by_name = {}
+        self.index = PlayerIndex()
+        self.loaded_at = datetime.now()
+
+        for player in players:
+            self.by_id[player['id']] = player
+            aliases = [player.get(key) for key in ALIAS_KEYS]
+            for name in (player['fullName'], *aliases):
+                if name:
+                    self.by_name.setdefault(normalize_name(name), player)
+            self.index.add(player['id'], player['fullName'], aliases, record=player)
+
+    def __len__(self):
+        return len(self.players)
+
+    def get(self, player_id):
+        return self.by_id.get(player_id)
+
+    def find(self, name: str):
+        return self.by_name.get(normalize_name(name))
+
+    def search(self, query: str, n: int = 3, cutoff: float = 0.6) -> list:
+        return self.index.search(query, n=n, cutoff=cutoff)
+
+
+_directory = MLBDirectory([])
+
+
+def get_directory() -> MLBDirectory:
+    return _directory
+
+
+def load_directory(path: str = DUMP_PATH, fallback=None) -> MLBDirectory:
+    global _directory
+    players = read_player_dump(path)
+    if not players and fallback is not None:
+        players = fallback()
+    directory = MLBDirectory(players)
+    _directory = directory
+    return directory
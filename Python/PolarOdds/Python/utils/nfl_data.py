@@ -0,0 +1,78 @@
+import os
+from datetime import datetime
+
+from utils.lazy import lazy_import
+
+nfl = lazy_import("nfl_data_py")
+pd = lazy_import("pandas")
+
+
+NFL_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'nfl')
+
+NON_STAT_COLUMNS = ['season', 'week']
+
+
+def aggregate_weekly(weekly):
+    columns = [c for c in weekly.select_dtypes('number').columns if c not in NON_STAT_COLUMNS]
+    return weekly.groupby('player_id')[columns].sum()
+
+
+class NFLSeasonData:
+    def __init__(self, season: int, data_dir: str = NFL_DATA_DIR):
+        self.season = season
+        self.data_dir = data_dir
+        self.roster = None
+        self.weekly = None
+        self.totals = None
+        self.last_week = 0
+        self.updated_at = None
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.data_dir, f"{name}_{self.season}.parquet")
+
+    def load(self):
+        paths = [self._path(name) for name in ('roster', 'weekly', 'totals')]
+        if all(os.path.exists(path) for path in paths):
+            try:
+                roster, weekly, totals = (pd.read_parquet(path) for path in paths)
+                self._swap(roster, weekly, totals)
+                return
+            except Exception as e:
+                print(f"Error reading NFL {self.season} cache, re-downloading: {e}")
+        self.refresh()
+
+    def refresh(self) -> bool:
+        roster = nfl.import_seasonal_rosters([self.season])
+        weekly = nfl.import_weekly_data([self.season])
+
+        # Weeks are published in stages and earlier weeks get stat
+        # corrections, so totals are always rebuilt from the whole season.
+        totals = aggregate_weekly(weekly).sort_index()
+        changed = self.totals is None or not totals.equals(self.totals)
+        if changed:
+            self._swap(roster, weekly, totals)
+            self._save()
+        else:
+            self.roster = roster
+        return changed
+
+    def _swap(self, roster, weekly, totals):
+        self.roster = roster
+        self.weekly = weekly
+        self.totals = totals
+        self.last_week = int(weekly['week'].max()) if not weekly.empty else 0
+        self.updated_at = datetime.now()
+
+    def _save(self):
+        try:
+            os.makedirs(self.data_dir, exist_ok=True)
+            self.roster.to_parquet(self._path('roster'))
+            self.weekly.to_parquet(self._path('weekly'))
+            self.totals.to_parquet(self._path('totals'))
+        except Exception as e:
+            print(f"Error saving NFL {self.season} cache: {e}")
+
+    def player_totals(self, player_id: str) -> dict:
+        if self.totals is None or player_id not in self.totals.index:
+            return None
+        return self.totals.loc[player_id].to_dict()
@@ -0,0 +1,143 @@
+import abc
+import asyncio
+import json
+import os
+from datetime import datetime
+from typing import NamedTuple
+
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+ODDS_FIXTURE_DIR = os.path.join(DATA_DIR, 'odds')
+ODDS_CONFIG_PATH = os.path.join(DATA_DIR, 'odds_provider.json')
+
+SPORTS = ("NBA", "NFL", "MLB")
+
+
+class LineMovement(NamedTuple):
+    sport: str
+    event_id: str
+    market: str
+    selection: str
+    old_price: int
+    new_price: int
+    old_point: float
+    new_point: float
+
+
+class OddsProvider(abc.ABC):
+    name = "base"
+    # Only live providers are shown to users; anything else is owner-only.
+    live = True
+
+    @abc.abstractmethod
+    async def fetch(self, sport: str) -> list:
+        ...
+
+
+class FixtureOddsProvider(OddsProvider):
+    name = "fixture"
+    live = False
+
+    def __init__(self, directory: str = ODDS_FIXTURE_DIR):
+        self.directory = directory
+
+    def _read(self, sport: str) -> list:
+        path = os.path.join(self.directory, f"{sport}.json")
+        if not os.path.exists(path):
+            return []
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    async def fetch(self, sport: str) -> list:
+        return await asyncio.to_thread(self._read, sport)
+
+
+ODDS_PROVIDERS = {provider.name: provider for provider in (FixtureOddsProvider,)}
+
+
+def load_odds_provider(path: str = ODDS_CONFIG_PATH):
+    config = {}
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+
+    name = config.get("provider")
+    if not name:
+        print(f"Warning: no odds provider configured in {path}, odds polling is off")
+        return None
+    if name not in ODDS_PROVIDERS:
+        print(f"Warning: unknown odds provider {name!r} in {path}, odds polling is off")
+        return None
+    return ODDS_PROVIDERS[name](**config.get("options", {}))
+
+
+class OddsBook:
+    def __init__(self, sport: str):
+        self.sport = sport
+        self.events = {}
+        self.lines = {}
+        self.updated_at = None
+
+    def __len__(self):
+        return len(self.events)
+
+    def apply(self, events: list) -> list:
+        movements = []
+        events_seen = set()
+        lines = {}
+
+        for event in events:
+            event_id = str(event['id'])
+            events_seen.add(event_id)
+            self.events[event_id] = {
+                'id': event_id,
+                'home_team': event.get('home_team'),
+                'away_team': event.get('away_team'),
+                'commence_time': event.get('commence_time')
+            }
+
+            for market, outcomes in event.get('markets', {}).items():
+                key = (event_id, market)
+                previous = self.lines.get(key, {})
+                current = {}
+                for outcome in outcomes:
+                    selection = outcome['name']
+                    price = outcome['price']
+                    point = outcome.get('point')
+                    current[selection] = (price, point)
+                    if selection in previous and previous[selection] != (price, point):
+                        old_price, old_point = previous[selection]
+                        movements.append(LineMovement(
+                            self.sport, event_id, market, selection, old_price, price, old_point, point
+                        ))
+                lines[key] = current
+
+        for event_id in list(self.events):
+            if event_id not in events_seen:
+                del self.events[event_id]
+
+        self.lines = lines
+        self.updated_at = datetime.now()
+        return movements
+
+    def market(self, event_id: str, market: str) -> dict:
+        return {
+            selection: {'price': price, 'point': point}
+            for selection, (price, point) in self.lines.get((str(event_id), market), {}).items()
+        }
+
+    def snapshot(self) -> dict:
+        events = {event_id: {**event, 'markets': {}} for event_id, event in self.events.items()}
+        for (event_id, market), outcomes in self.lines.items():
+            events[event_id]['markets'][market] = {
+                selection: {'price': price, 'point': point}
+                for selection, (price, point) in outcomes.items()
+            }
+        return {
+            'sport': self.sport,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'events': events
+        }
+
+
+odds_books = {sport: OddsBook(sport) for sport in SPORTS}
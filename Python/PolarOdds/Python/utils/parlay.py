@@ -0,0 +1,123 @@
+import json
+import os
+from itertools import chain, combinations
+from typing import NamedTuple
+
+import numpy as np
+
+
+PROJECTIONS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'projections.json')
+
+
+class ParlayScores(NamedTuple):
+    combos: np.ndarray
+    decimal_odds: np.ndarray
+    american_odds: np.ndarray
+    probability: np.ndarray
+    fair_american_odds: np.ndarray
+    expected_value: np.ndarray
+
+
+def american_to_decimal(odds) -> np.ndarray:
+    odds = np.asarray(odds, dtype=float)
+    return np.where(odds > 0, 1 + odds / 100, 1 + 100 / np.abs(odds))
+
+
+def decimal_to_american(decimal) -> np.ndarray:
+    decimal = np.asarray(decimal, dtype=float)
+    with np.errstate(divide='ignore'):
+        return np.where(decimal >= 2, (decimal - 1) * 100, -100 / (decimal - 1))
+
+
+def implied_probability(odds) -> np.ndarray:
+    return 1 / american_to_decimal(odds)
+
+
+def remove_vig(odds) -> np.ndarray:
+    probability = implied_probability(odds)
+    return probability / probability.sum(axis=-1, keepdims=True)
+
+
+def leg_combinations(n_legs: int, size: int) -> np.ndarray:
+    flat = np.fromiter(chain.from_iterable(combinations(range(n_legs), size)), dtype=np.intp)
+    return flat.reshape(-1, size)
+
+
+def score_parlays(prices, probabilities, combos) -> ParlayScores:
+    combos = np.asarray(combos, dtype=np.intp)
+    decimal = american_to_decimal(prices)[combos].prod(axis=-1)
+    probability = np.asarray(probabilities, dtype=float)[combos].prod(axis=-1)
+    return ParlayScores(
+        combos=combos,
+        decimal_odds=decimal,
+        american_odds=decimal_to_american(decimal),
+        probability=probability,
+        fair_american_odds=decimal_to_american(1 / probability),
+        expected_value=probability * decimal - 1
+    )
+
+
+def evaluate_parlay(prices, probabilities=None) -> ParlayScores:
+    prices = np.asarray(prices, dtype=float)
+    if probabilities is None:
+        probabilities = implied_probability(prices)
+    return score_parlays(prices, probabilities, np.arange(len(prices))[np.newaxis, :])
+
+
+def rank_parlays(prices, probabilities, size: int, top: int = 10, groups=None) -> ParlayScores:
+    combos = leg_combinations(len(prices), size)
+    if groups is not None and size > 1:
+        # Drop parlays with two legs from the same group (e.g. both sides
+        # of one market, or correlated legs from one event).
+        grouped = np.sort(np.asarray(groups)[combos], axis=1)
+        combos = combos[~(grouped[:, 1:] == grouped[:, :-1]).any(axis=1)]
+    scores = score_parlays(prices, probabilities, combos)
+
+    top = min(top, len(combos))
+    if top <= 0:
+        return score_parlays(prices, probabilities, combos[:0])
+    best = np.argpartition(-scores.expected_value, top - 1)[:top]
+    best = best[np.argsort(-scores.expected_value[best])]
+    return ParlayScores(*(field[best] for field in scores))
+
+
+def load_projections(sport: str, path: str = PROJECTIONS_PATH) -> dict:
+    config = {}
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+
+    projections = {}
+    for entry in config.get(sport, []):
+        probability = float(entry['probability'])
+        if not 0 < probability < 1:
+            raise ValueError(f"{entry['selection']} has probability {probability}, expected between 0 and 1")
+        projections[(str(entry['event_id']), entry['market'], entry['selection'])] = probability
+    return projections
+
+
+def book_legs(book, projections: dict, markets=('h2h', 'spreads', 'totals')):
+    # The book's own vig-free prices can't be the true probability, since
+    # every parlay would then have EV <= 0. Only legs with an independent
+    # projection are returned.
+    labels, prices, probabilities, groups = [], [], [], []
+    for (event_id, market), outcomes in book.lines.items():
+        if market not in markets:
+            continue
+        event = book.events.get(event_id, {})
+        matchup = f"{event.get('away_team')} @ {event.get('home_team')}"
+        for selection, (price, point) in outcomes.items():
+            probability = projections.get((event_id, market, selection))
+            if probability is None:
+                continue
+            if point is None:
+                label = f"{matchup}: {selection}"
+            elif market == 'spreads':
+                label = f"{matchup}: {selection} {point:+g}"
+            else:
+                label = f"{matchup}: {selection} {point:g}"
+            labels.append(label)
+            prices.append(price)
+            probabilities.append(probability)
+            groups.append(event_id)
+    return labels, np.array(prices, dtype=float), np.array(probabilities, dtype=float), groups
@@ -0,0 +1,28 @@
+class StateRegistry:
+    def __init__(self):
+        self._entries = {}
+
+    def acquire(self, name: str, version, factory):
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] == version:
+            return entry[1], True
+
+        state = factory()
+        self._entries[name] = (version, state)
+        if entry is not None:
+            print(f"Discarded {name} state from version {entry[0]}, now version {version}.")
+        return state, False
+
+    def discard(self, name: str):
+        return self._entries.pop(name, (None, None))[1]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+
+def get_registry(bot) -> StateRegistry:
+    registry = getattr(bot, "state_registry", None)
+    if registry is None:
+        registry = StateRegistry()
+        bot.state_registry = registry
+    return registry
@@ -0,0 +1,163 @@
+import bisect
+import heapq
+import unicodedata
+from collections import Counter, defaultdict
+from itertools import chain, islice
+from difflib import SequenceMatcher
+from typing import NamedTuple
+
+
+# Lowest trigram similarity a name needs to be scored outside the shortlist.
+WIDEN_DICE = 0.3
+
+
+class Match(NamedTuple):
+    player_id: object
+    name: str
+    score: float
+
+
+def normalize_name(name: str) -> str:
+    name = unicodedata.normalize("NFKD", str(name))
+    name = "".join(c for c in name if not unicodedata.combining(c))
+    for char in ".,'`-":
+        name = name.replace(char, " " if char in ",-" else "")
+    return " ".join(name.lower().split())
+
+
+def trigrams(text: str) -> set:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerIndex:
+    def __init__(self, shortlist: int = 24):
+        self.shortlist = shortlist
+        self.records = {}
+        self.names = {}
+        self.weights = {}
+        self._keys = []
+        self._owners = []
+        self._gram_counts = []
+        self._aliases = []
+        self._exact = defaultdict(set)
+        self._postings = defaultdict(list)
+        self._alias_postings = defaultdict(list)
+        self._prefixes = []
+        self._prefixes_sorted = True
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, player_id):
+        return player_id in self.records
+
+    def add(self, player_id, name: str, aliases=(), record=None, weight: float = 0.0):
+        self.records[player_id] = record
+        self.names[player_id] = name
+        self.weights[player_id] = weight
+        seen = set()
+        for position, alias in enumerate((name, *aliases)):
+            if not alias:
+                continue
+            key = normalize_name(alias)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            slot = len(self._keys)
+            grams = trigrams(key)
+            self._keys.append(key)
+            self._owners.append(player_id)
+            self._gram_counts.append(len(grams))
+            self._aliases.append(position > 0)
+            self._exact[key].add(slot)
+            postings = self._alias_postings if position else self._postings
+            for gram in grams:
+                postings[gram].append(slot)
+            # Every word start is a completion entry, so "judge" finds
+            # "aaron judge" as well as the full name prefix does.
+            words = key.split(" ")
+            for i in range(len(words)):
+                self._prefixes.append((" ".join(words[i:]), slot))
+            self._prefixes_sorted = False
+
+    def get(self, player_id):
+        return self.records.get(player_id)
+
+    def search(self, query: str, n: int = 3, cutoff: float = 0.6, widen: bool = True) -> list:
+        query = normalize_name(query)
+        if not query:
+            return []
+
+        grams = trigrams(query)
+        exact = self._exact.get(query, ())
+
+        # Same scoring as difflib.get_close_matches over full names. Aliases
+        # are often just a last name, so they are only tried when no full
+        # name matches at all.
+        matcher = SequenceMatcher()
+        matcher.set_seq2(query)
+        for aliases, postings in ((False, self._postings), (True, self._alias_postings)):
+            overlap = Counter(chain.from_iterable(postings.get(gram, ()) for gram in grams))
+            best = {self._owners[slot]: 1.0 for slot in exact if self._aliases[slot] is aliases}
+            self._match(matcher, overlap, len(grams), n, cutoff, widen and not best, best)
+            if best:
+                break
+
+        top = heapq.nlargest(n, best.items(), key=lambda item: (item[1], self.names[item[0]].lower()))
+        return [Match(owner, self.names[owner], score) for owner, score in top]
+
+    def _match(self, matcher, overlap: Counter, query_grams: int, n: int, cutoff: float, widen: bool, best: dict):
+        candidates = heapq.nlargest(
+            self.shortlist,
+            overlap,
+            key=lambda slot: 2 * overlap[slot] / (query_grams + self._gram_counts[slot])
+        )
+        self._score(matcher, candidates, cutoff, best)
+
+        # When the trigram shortlist leaves fewer than n players, the other
+        # names sharing at least WIDEN_DICE of their trigrams are scored too.
+        if widen and len(best) < n and len(overlap) > len(candidates):
+            shortlisted = set(candidates)
+            rest = [
+                slot for slot, count in overlap.items()
+                if 2 * count >= WIDEN_DICE * (query_grams + self._gram_counts[slot]) and slot not in shortlisted
+            ]
+            self._score(matcher, rest, cutoff, best)
+
+    def _score(self, matcher, slots, cutoff: float, best: dict):
+        for slot in slots:
+            matcher.set_seq1(self._keys[slot])
+            if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+                continue
+            score = matcher.ratio()
+            owner = self._owners[slot]
+            if score >= cutoff and score > best.get(owner, 0.0):
+                best[owner] = score
+
+    def complete(self, query: str, n: int = 25, scan: int = 2000, cutoff: float = 0.5) -> list:
+        query = normalize_name(query)
+        if not query:
+            return []
+        if not self._prefixes_sorted:
+            self._prefixes.sort()
+            self._prefixes_sorted = True
+
+        start = bisect.bisect_left(self._prefixes, (query,))
+        ranked = {}
+        for text, slot in islice(self._prefixes, start, start + scan):
+            if not text.startswith(query):
+                break
+            key = self._keys[slot]
+            owner = self._owners[slot]
+            # Full name prefixes before later word prefixes, then heavier
+            # weighted players, then shorter names.
+            rank = (text != key, -self.weights[owner], len(key))
+            if owner not in ranked or rank < ranked[owner]:
+                ranked[owner] = rank
+
+        owners = heapq.nsmallest(n, ranked, key=ranked.get)
+        matches = [Match(owner, self.names[owner], len(query) / ranked[owner][2]) for owner in owners]
+        if len(matches) < n and len(query) >= 3:
+            matches += [m for m in self.search(query, n=n, cutoff=cutoff, widen=False) if m.player_id not in ranked][:n - len(matches)]
+        return matches
@@ -0,0 +1,54 @@
+import asyncio
+from collections import Counter
+
+
+class SingleFlight:
+    def __init__(self):
+        self._calls = {}
+        self._waiters = Counter()
+        self._speculative = set()
+
+    def __contains__(self, key):
+        return key in self._calls
+
+    async def do(self, key, func, *args, **kwargs):
+        # A real caller joining a speculative call keeps it alive.
+        self._speculative.discard(key)
+        return await self._join(key, self._start(key, func, args, kwargs))
+
+    async def do_speculative(self, key, func, *args, **kwargs):
+        # Same as do(), but a call started here is cancelled once every
+        # caller waiting on it has been cancelled, unless do() joined it.
+        if key not in self._calls:
+            self._speculative.add(key)
+        return await self._join(key, self._start(key, func, args, kwargs))
+
+    def _start(self, key, func, args, kwargs):
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func(*args, **kwargs))
+            self._calls[key] = future
+            future.add_done_callback(lambda f: self._finish(key, f))
+        return future
+
+    async def _join(self, key, future):
+        self._waiters[future] += 1
+        try:
+            # Shield the shared call so one caller giving up does not cancel
+            # the fetch for everyone else waiting on it.
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if self._waiters[future] == 1 and key in self._speculative and self._calls.get(key) is future:
+                future.cancel()
+            raise
+        finally:
+            self._waiters[future] -= 1
+            if not self._waiters[future]:
+                del self._waiters[future]
+
+    def _finish(self, key, future):
+        if self._calls.get(key) is future:
+            del self._calls[key]
+            self._speculative.discard(key)
+        if not future.cancelled():
+            future.exception()
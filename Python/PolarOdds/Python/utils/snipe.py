@@ -0,0 +1,52 @@
+import time
+from collections import OrderedDict, deque
+
+
+class DeletedMessage:
+    __slots__ = ('content', 'author', 'deleted_at')
+
+    def __init__(self, content: str, author: str):
+        self.content = content
+        self.author = author
+        self.deleted_at = time.time()
+
+
+class EditedMessage:
+    __slots__ = ('before', 'after', 'author', 'edited_at')
+
+    def __init__(self, before: str, after: str, author: str):
+        self.before = before
+        self.after = after
+        self.author = author
+        self.edited_at = time.time()
+
+
+class SnipeLog:
+    def __init__(self, per_channel: int = 10, max_channels: int = 1000):
+        self.per_channel = per_channel
+        self.max_channels = max_channels
+        self._channels = OrderedDict()
+
+    def __len__(self):
+        return sum(len(records) for records in self._channels.values())
+
+    def add(self, guild_id: int, channel_id: int, record):
+        key = (guild_id, channel_id)
+        records = self._channels.get(key)
+        if records is None:
+            records = self._channels[key] = deque(maxlen=self.per_channel)
+            if len(self._channels) > self.max_channels:
+                self._channels.popitem(last=False)
+        else:
+            self._channels.move_to_end(key)
+        records.append(record)
+
+    def latest(self, guild_id: int, channel_id: int):
+        records = self._channels.get((guild_id, channel_id))
+        if not records:
+            return None
+        self._channels.move_to_end((guild_id, channel_id))
+        return records[-1]
+
+    def clear(self, guild_id: int, channel_id: int) -> bool:
+        return self._channels.pop((guild_id, channel_id), None) is not None
@@ -0,0 +1,96 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+STORE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'stats.db')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    sport TEXT NOT NULL,
+    player_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (sport, player_id)
+);
+CREATE TABLE IF NOT EXISTS stats (
+    sport TEXT NOT NULL,
+    cache_key TEXT NOT NULL,
+    data TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (sport, cache_key)
+);
+CREATE INDEX IF NOT EXISTS stats_by_fetched ON stats (sport, fetched_at);
+"""
+
+
+class StatsStore:
+    def __init__(self, path: str = STORE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def put_stats(self, sport: str, cache_key: str, data, ttl: float):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO stats (sport, cache_key, data, fetched_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (sport, cache_key, json.dumps(data, default=str), now, now + ttl)
+            )
+
+    def get_stats(self, sport: str, cache_key: str, max_stale: float = 0):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, expires_at FROM stats WHERE sport = ? AND cache_key = ? AND expires_at > ?",
+                (sport, cache_key, time.time() - max_stale)
+            ).fetchone()
+        return (json.loads(row[0]), row[1]) if row else None
+
+    def recent_stats(self, sport: str, limit: int, max_stale: float = 0) -> list:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT cache_key, data, expires_at FROM stats WHERE sport = ? AND expires_at > ? "
+                "ORDER BY fetched_at DESC LIMIT ?",
+                (sport, time.time() - max_stale, limit)
+            ).fetchall()
+        return [(key, json.loads(data), expires_at) for key, data, expires_at in rows]
+
+    def delete_stats(self, sport: str) -> int:
+        with self._lock:
+            return self._conn.execute("DELETE FROM stats WHERE sport = ?", (sport,)).rowcount
+
+    def put_players(self, sport: str, players: list):
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute("DELETE FROM players WHERE sport = ?", (sport,))
+                self._conn.executemany(
+                    "INSERT INTO players (sport, player_id, name, data, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    [(sport, str(player_id), name, json.dumps(data, default=str), now) for player_id, name, data in players]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def get_players(self, sport: str) -> list:
+        with self._lock:
+            rows = self._conn.execute("SELECT data FROM players WHERE sport = ?", (sport,)).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def purge_expired(self, max_stale: float = 0) -> int:
+        with self._lock:
+            return self._conn.execute("DELETE FROM stats WHERE expires_at <= ?", (time.time() - max_stale,)).rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,46 @@
+import hashlib
+import json
+import os
+
+
+TREE_STATE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'command_tree.json')
+
+
+def tree_fingerprint(tree, guild=None) -> str:
+    payload = sorted(
+        (command.to_dict(tree) for command in tree.get_commands(guild=guild)),
+        key=lambda command: (command.get('type', 1), command['name'])
+    )
+    encoded = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def load_tree_state(path: str = TREE_STATE_PATH) -> dict:
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Error reading command tree state: {e}")
+        return {}
+
+
+def save_tree_state(state: dict, path: str = TREE_STATE_PATH):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+async def sync_tree(tree, guild=None, force: bool = False, path: str = TREE_STATE_PATH) -> bool:
+    scope = str(guild.id) if guild else "global"
+    fingerprint = tree_fingerprint(tree, guild=guild)
+    state = load_tree_state(path)
+    if not force and state.get(scope) == fingerprint:
+        return False
+
+    await tree.sync(guild=guild)
+    state[scope] = fingerprint
+    save_tree_state(state, path)
+    return True